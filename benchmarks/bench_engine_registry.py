@@ -0,0 +1,45 @@
+"""
+Per-call overhead of engine identity checks, with and without the
+code-hash cache.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_engine_registry.py [--calls N]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+
+from spectrum.engines import clear_code_hash_cache, code_hash_cache_info, get_engine_spec
+from spectrum.engines.examples import add_one_engine
+from spectrum.engines.registry import _hash_source
+
+
+def _per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    uncached = _per_call(lambda: _hash_source(add_one_engine), args.calls)
+
+    clear_code_hash_cache()
+    cached = _per_call(
+        lambda: get_engine_spec("add_one", "1.0.0", add_one_engine), args.calls
+    )
+
+    print(f"getsource + sha256   {uncached * 1e6:9.2f} us/call")
+    print(f"get_engine_spec      {cached * 1e6:9.2f} us/call")
+    print(f"cache                {code_hash_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
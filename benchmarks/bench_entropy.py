@@ -0,0 +1,49 @@
+"""
+Throughput of fixed-point entropy classification.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_entropy.py [--transitions N] [--dim D]
+
+Reports the vectorized kernel on pre-packed integer weights and the full
+path from Fraction transitions. Benchmarks are not part of the
+deterministic core; they measure wall time only.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from spectrum.irreversibility.detect import Transition
+from spectrum.irreversibility.entropy import classify_irreversible, entropy_fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transitions", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=4)
+    args = parser.parse_args()
+    n, d = args.transitions, args.dim
+
+    weights = (np.arange(n * d, dtype=np.int64).reshape(n, d) % 97) + 1
+    start = time.perf_counter()
+    entropy_fixed(weights)
+    elapsed = time.perf_counter() - start
+    print(f"kernel (packed weights)  {n / elapsed:14,.0f} states/s")
+
+    transitions = [
+        Transition(
+            tuple(Fraction(1 + (i + k) % 9, 1 + k % 3) for k in range(d)),
+            tuple(Fraction(1 + (i * k) % 5, 2) for k in range(d)),
+        )
+        for i in range(n)
+    ]
+    start = time.perf_counter()
+    classify_irreversible(transitions)
+    elapsed = time.perf_counter() - start
+    print(f"classify (Fraction input) {n / elapsed:13,.0f} transitions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Throughput of the global invariant engine on chains and wide DAGs.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_global_invariants.py [--nodes N] [--width W]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+from spectrum.lattice.node import LatticeNode
+from spectrum.invariants.global_invariants import (
+    check_global_invariants,
+    unique_node_ids,
+    no_orphan_nodes,
+    parents_are_acyclic,
+)
+
+_ZERO = (Fraction(0),)
+
+
+def _chain(count):
+    return [
+        LatticeNode(id=i, state_vector=_ZERO, parents={i - 1} if i else set())
+        for i in range(count)
+    ]
+
+
+def _wide_dag(count, width):
+    nodes = []
+    for i in range(count):
+        layer, pos = divmod(i, width)
+        if layer == 0:
+            parents = set()
+        else:
+            base = (layer - 1) * width
+            parents = {base + pos, base + (pos + 1) % width}
+        nodes.append(LatticeNode(id=i, state_vector=_ZERO, parents=parents))
+    return nodes
+
+
+def _time(label, fn, nodes):
+    start = time.perf_counter()
+    result = fn(nodes)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s {len(nodes) / elapsed:14,.0f} nodes/s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--width", type=int, default=1000)
+    args = parser.parse_args()
+
+    for name, nodes in (
+        ("chain", _chain(args.nodes)),
+        ("wide", _wide_dag(args.nodes, args.width)),
+    ):
+        report = _time(f"{name} check_global_invariants", check_global_invariants, nodes)
+        assert report.ok
+        _time(f"{name} unique_node_ids", unique_node_ids, nodes)
+        _time(f"{name} no_orphan_nodes", no_orphan_nodes, nodes)
+        _time(f"{name} parents_are_acyclic", parents_are_acyclic, nodes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Memory comparison: plain vs interned state vectors over a deep lattice.
+
+Each layer adds a constant to a window of states that repeats, so many
+nodes across the lattice carry equal state vectors.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_interning.py [--width W] [--depth D] [--dim N]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+and allocation only and never feed results back into Spectrum.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from fractions import Fraction
+
+from spectrum.lattice.intern import InternTable
+
+
+def _build(width, depth, dim, make_state):
+    layers = []
+    step = Fraction(1, 3)
+    for d in range(depth):
+        layer = []
+        for i in range(width):
+            base = Fraction(i % 17, 1 + i % 5)
+            layer.append(make_state(base + step * (d % 11) + k for k in range(dim)))
+        layers.append(layer)
+    return layers
+
+
+def _measure(label, width, depth, dim, make_state):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = _build(width, depth, dim, make_state)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<9} {elapsed:8.3f}s "
+        f"{width * depth / elapsed:12,.0f} states/s "
+        f"{current / 2**20:10.1f} MiB"
+    )
+    return built
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=2_000)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=4)
+    args = parser.parse_args()
+
+    plain = _measure("plain", args.width, args.depth, args.dim, tuple)
+    del plain
+
+    table = InternTable()
+    interned = _measure("interned", args.width, args.depth, args.dim, table.state)
+    print(f"interned  {table.stats()}")
+    del interned
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Memory / throughput comparison: LatticeNode objects vs LatticeStore.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_lattice_store.py [--nodes N] [--dim D]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+and allocation only and never feed results back into Spectrum.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from fractions import Fraction
+
+from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.store import LatticeStore
+from spectrum.serialization.canonical import hash_nodes, hash_store
+
+
+def _state(i, dim):
+    return tuple(Fraction(i % 7 + k, 1 + (i + k) % 3) for k in range(dim))
+
+
+def _build_nodes(count, dim):
+    return [
+        LatticeNode(id=i, state_vector=_state(i, dim), parents={i - 1} if i else set())
+        for i in range(count)
+    ]
+
+
+def _build_store(count, dim):
+    store = LatticeStore()
+    for i in range(count):
+        store.append(i, _state(i, dim), (i - 1,) if i else ())
+    return store
+
+
+def _measure(label, build, count, dim):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = build(count, dim)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<8} build {elapsed:8.3f}s "
+        f"{count / elapsed:12,.0f} nodes/s "
+        f"{current / 2**20:10.1f} MiB"
+    )
+    return built
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=4)
+    args = parser.parse_args()
+
+    nodes = _measure("objects", _build_nodes, args.nodes, args.dim)
+    start = time.perf_counter()
+    h1 = hash_nodes(nodes)
+    print(f"objects  hash  {time.perf_counter() - start:8.3f}s")
+    del nodes
+
+    store = _measure("store", _build_store, args.nodes, args.dim)
+    start = time.perf_counter()
+    h2 = hash_store(store)
+    print(f"store    hash  {time.perf_counter() - start:8.3f}s")
+
+    assert h1 == h2, "digest mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Serial vs multi-process layer expansion.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_parallel_expansion.py [--nodes N] [--dim D] [--workers W]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+from spectrum.expand.rules import expand_deterministically
+from spectrum.expansion.parallel import expand_deterministically_parallel
+from spectrum.lattice.node import LatticeNode
+
+
+def _layer(count, dim):
+    return [
+        LatticeNode(
+            id=i,
+            state_vector=tuple(Fraction(i % 7 + k, 1 + (i + k) % 3) for k in range(dim)),
+            parents=set(),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    layer = _layer(args.nodes, args.dim)
+    constant = Fraction(1, 3)
+
+    start = time.perf_counter()
+    serial = expand_deterministically(layer, constant)
+    print(f"serial     {time.perf_counter() - start:8.3f}s")
+
+    start = time.perf_counter()
+    parallel = expand_deterministically_parallel(layer, constant, args.workers)
+    print(f"workers={args.workers:<2} {time.perf_counter() - start:8.3f}s")
+
+    assert serial == parallel, "output mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Chain expansion cost: tuple copies vs persistent state vectors.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_persistent_vector.py [--depth D]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+and allocation only and never feed results back into Spectrum.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from fractions import Fraction
+
+from spectrum.lattice.pvector import PersistentVector
+
+
+def _chain(depth, empty):
+    one = Fraction(1)
+    states = [empty]
+    for _ in range(depth):
+        states.append(states[-1] + (one,))
+    return states
+
+
+def _measure(label, depth, empty):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    states = _chain(depth, empty)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<11} {elapsed:8.3f}s {current / 2**20:10.1f} MiB")
+    return states[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=5_000)
+    args = parser.parse_args()
+
+    a = _measure("tuple", args.depth, ())
+    b = _measure("persistent", args.depth, PersistentVector())
+    assert a == b
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Fraction vs Rational on expansion and metric workloads.
+
+  - expansion: add a shared-denominator constant to every component of a
+    layer of states, step after step (apply_rule_add_constant)
+  - parity:    per-group positive rates from demographic_parity (with
+    Fraction or Rational rates and outputs) and their pairwise gaps
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_rational.py [--states N] [--dim D] [--steps S] [--samples M]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+from spectrum.metrics.fairness import demographic_parity
+from spectrum.rational.fixed import Rational
+
+
+def _expansion(kind, states, dim, steps):
+    layer = [tuple(kind(i % 11 + k, 12) for k in range(dim)) for i in range(states)]
+    constant = kind(5, 12)
+    for _ in range(steps):
+        layer = [tuple(x + constant for x in s) for s in layer]
+    return [tuple(Fraction(x.numerator, x.denominator) for x in s) for s in layer]
+
+
+def _parity_inputs(kind, samples):
+    groups = [i % 16 for i in range(samples)]
+    one, zero = kind(1), kind(0)
+    outputs = [one if (i * 7) % 3 == 0 else zero for i in range(samples)]
+    return outputs, groups
+
+
+def _parity(kind, outputs, groups):
+    rates = list(demographic_parity(outputs, groups, rate=kind).values())
+    gap = kind(0)
+    for a in rates:
+        for b in rates:
+            gap = gap + (a - b if a > b else b - a)
+    return Fraction(gap.numerator, gap.denominator)
+
+
+def _time(label, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<20} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--states", type=int, default=20_000)
+    parser.add_argument("--dim", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    a = _time("expansion Fraction", _expansion, Fraction, args.states, args.dim, args.steps)
+    b = _time("expansion Rational", _expansion, Rational, args.states, args.dim, args.steps)
+    assert a == b, "expansion mismatch"
+
+    a = _time("parity    Fraction", _parity, Fraction, *_parity_inputs(Fraction, args.samples))
+    b = _time("parity    Rational", _parity, Rational, *_parity_inputs(Rational, args.samples))
+    assert a == b, "parity mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+add(constant) over a whole layer: per-node Fractions vs RationalVector.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_rational_vector.py [--nodes N] [--dim D]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+from spectrum.expand.rules import (
+    expand_deterministically,
+    expand_deterministically_vectorized,
+)
+from spectrum.lattice.node import LatticeNode
+from spectrum.rational.vector import RationalVector
+
+
+def _layer(count, dim):
+    return [
+        LatticeNode(
+            id=i,
+            state_vector=tuple(Fraction(i % 97 + k, 12) for k in range(dim)),
+            parents=set(),
+        )
+        for i in range(count)
+    ]
+
+
+def _time(label, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<18} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=8)
+    args = parser.parse_args()
+
+    layer = _layer(args.nodes, args.dim)
+    constant = Fraction(5, 12)
+
+    serial = _time("per-node", expand_deterministically, layer, constant)
+    vectorized = _time("vectorized layer", expand_deterministically_vectorized, layer, constant)
+    assert serial == vectorized, "output mismatch"
+
+    states = RationalVector.from_states([n.state_vector for n in layer])
+    _time("vector add only", states.__add__, constant)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Replay parse throughput in lines/second: verified vs trusted mode.
+
+Generates a canonical dump (or reads an existing one with --path) and
+parses it line by line in each mode. Use --nodes to scale the generated
+dump to multi-gigabyte sizes.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_replay_parse.py [--nodes N] [--dim D] [--path FILE]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from fractions import Fraction
+
+from spectrum.lattice.node import LatticeNode
+from spectrum.replay.replay import parse_node
+from spectrum.serialization.canonical import write_nodes
+
+
+def _generate(path, count, dim):
+    nodes = (
+        LatticeNode(
+            id=i,
+            state_vector=tuple(Fraction(i % 97 + k, 1 + (i + k) % 5) for k in range(dim)),
+            parents={i - 1, i // 2} if i else set(),
+        )
+        for i in range(count)
+    )
+    with open(path, "wb") as fp:
+        write_nodes(nodes, fp, presorted=True)
+
+
+def _parse(path, trusted):
+    count = 0
+    start = time.perf_counter()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parse_node(line.rstrip("\n"), trusted)
+            count += 1
+    return count, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=500_000)
+    parser.add_argument("--dim", type=int, default=8)
+    parser.add_argument("--path", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path
+        if path is None:
+            path = os.path.join(tmp, "lattice.txt")
+            _generate(path, args.nodes, args.dim)
+        size = os.path.getsize(path)
+
+        for label, trusted in (("verified", False), ("trusted", True)):
+            count, elapsed = _parse(path, trusted)
+            print(
+                f"{label:<9} {elapsed:8.3f}s "
+                f"{count / elapsed:12,.0f} lines/s "
+                f"{size / elapsed / 2**20:8.1f} MiB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Repeated hashing of the same nodes: cold vs memoized canonical lines.
+Lines are memoized for up to LINE_CACHE_SIZE nodes; beyond that, every
+round runs cold.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_serialization_cache.py [--nodes N] [--dim D] [--rounds R]
+
+Benchmarks are not part of the deterministic core; they measure wall time
+only and never feed results back into Spectrum.
+"""
+
+import argparse
+import time
+from fractions import Fraction
+
+from spectrum.lattice.node import LatticeNode
+from spectrum.serialization.canonical import hash_nodes, serialization_cache_info
+
+
+def _nodes(count, dim):
+    return [
+        LatticeNode(
+            id=i,
+            state_vector=tuple(Fraction(i % 7 + k, 1 + (i + k) % 3) for k in range(dim)),
+            parents={i - 1, i // 2} if i else set(),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    nodes = _nodes(args.nodes, args.dim)
+    for r in range(args.rounds):
+        start = time.perf_counter()
+        hash_nodes(nodes)
+        label = "cold" if r == 0 else "cached"
+        print(f"round {r} ({label:<6}) {time.perf_counter() - start:8.3f}s")
+    print(serialization_cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Shared machinery for batched execution.
+
+Rules:
+- Every state is validated before any state is executed
+- Results are returned in input order, regardless of worker count
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from spectrum.invariants import check_invariants
+from spectrum.logging import ExecutionRecord, batch_digest, record_execution
+
+
+@dataclass(frozen=True)
+class ExecutionBatch:
+    """
+    Records in input order and the Merkle root over their digests.
+    """
+    records: Tuple[ExecutionRecord, ...]
+    digest: str
+
+
+def check_batch_invariants(
+    states: Sequence[Mapping[str, Any]],
+) -> Tuple[Dict[str, bool], ...]:
+    results = tuple(check_invariants(state) for state in states)
+    for r in results:
+        if not all(r.values()):
+            raise AssertionError("Invariant violation")
+    return results
+
+
+def map_states(
+    fn: Callable,
+    states: Sequence[Mapping[str, Any]],
+    workers: Optional[int],
+) -> Tuple[Any, ...]:
+    """
+    Apply fn to every state, optionally in a process pool.
+    fn must then be picklable (a module-level function).
+    """
+    if workers is None or workers <= 1 or len(states) <= 1:
+        return tuple(fn(state) for state in states)
+
+    chunksize = max(1, len(states) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return tuple(pool.map(fn, states, chunksize=chunksize))
+
+
+def record_batch(
+    engine: str,
+    states: Sequence[Mapping[str, Any]],
+    outputs: Sequence[Any],
+    invariant_results: Sequence[Mapping[str, bool]],
+    sink=None,
+) -> ExecutionBatch:
+    records = tuple(
+        record_execution(
+            engine=engine,
+            input_state=state,
+            output=output,
+            invariants=invariants,
+        )
+        for state, output, invariants in zip(states, outputs, invariant_results)
+    )
+
+    if sink is not None:
+        for record in records:
+            sink.append(record)
+
+    return ExecutionBatch(
+        records=records,
+        digest=batch_digest([r.digest for r in records]),
+    )
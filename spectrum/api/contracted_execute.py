@@ -2,7 +2,13 @@
 Execution with enforced interface contracts.
 """
 
-from typing import Mapping, Any, Callable
+from typing import Iterable, Mapping, Any, Callable, Optional
+from spectrum.api.batch import (
+    ExecutionBatch,
+    check_batch_invariants,
+    map_states,
+    record_batch,
+)
 from spectrum.contracts import Contract, enforce_contract
 from spectrum.logging import record_execution
 from spectrum.invariants import check_invariants
@@ -14,6 +20,7 @@ def execute_with_contract(
     state: Mapping[str, Any],
     contract: Contract,
     fn: Callable,
+    sink=None,
 ):
     invariant_results = check_invariants(state)
     if not all(invariant_results.values()):
@@ -22,9 +29,41 @@ def execute_with_contract(
     safe_fn = enforce_contract(contract, fn)
     output = safe_fn(state)
 
-    return record_execution(
+    record = record_execution(
         engine=engine,
         input_state=state,
         output=output,
         invariants=invariant_results,
     )
+
+    if sink is not None:
+        sink.append(record)
+
+    return record
+
+
+def execute_batch_with_contract(
+    *,
+    engine: str,
+    states: Iterable[Mapping[str, Any]],
+    contract: Contract,
+    fn: Callable,
+    workers: Optional[int] = None,
+    sink=None,
+) -> ExecutionBatch:
+    """
+    Batched execute_with_contract.
+
+    Invariants and contract inputs are validated for the whole batch before
+    fn runs; outputs are validated before anything is recorded.
+    """
+    states = tuple(states)
+    invariant_results = check_batch_invariants(states)
+    for state in states:
+        contract.validate_input(state)
+
+    outputs = map_states(fn, states, workers)
+    for output in outputs:
+        contract.validate_output(output)
+
+    return record_batch(engine, states, outputs, invariant_results, sink)
@@ -2,9 +2,13 @@
 Execution that enforces canonical engine identity.
 """
 
-from typing import Mapping, Any, Callable
+from typing import Iterable, Mapping, Any, Callable, Optional
 from spectrum.engines import get_engine_spec
-from spectrum.api.contracted_execute import execute_with_contract
+from spectrum.api.batch import ExecutionBatch
+from spectrum.api.contracted_execute import (
+    execute_batch_with_contract,
+    execute_with_contract,
+)
 from spectrum.contracts import Contract
 
 
@@ -15,6 +19,7 @@ def execute_engine(
     engine_fn: Callable,
     contract: Contract,
     state: Mapping[str, Any],
+    sink=None,
 ):
     spec = get_engine_spec(engine_name, engine_version, engine_fn)
 
@@ -23,6 +28,32 @@ def execute_engine(
         state=state,
         contract=contract,
         fn=engine_fn,
+        sink=sink,
     )
 
     return record
+
+
+def execute_engine_batch(
+    *,
+    engine_name: str,
+    engine_version: str,
+    engine_fn: Callable,
+    contract: Contract,
+    states: Iterable[Mapping[str, Any]],
+    workers: Optional[int] = None,
+    sink=None,
+) -> ExecutionBatch:
+    """
+    Batched execute_engine: engine identity is resolved and sealed once.
+    """
+    spec = get_engine_spec(engine_name, engine_version, engine_fn)
+
+    return execute_batch_with_contract(
+        engine=f"{spec.name}@{spec.version}",
+        states=states,
+        contract=contract,
+        fn=engine_fn,
+        workers=workers,
+        sink=sink,
+    )
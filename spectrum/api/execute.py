@@ -2,15 +2,23 @@
 Deterministic execution wrapper with audit logging.
 """
 
-from typing import Mapping, Any
+from typing import Iterable, Mapping, Any, Optional
+from spectrum.api.batch import (
+    ExecutionBatch,
+    check_batch_invariants,
+    map_states,
+    record_batch,
+)
 from spectrum.api.verify import verify
 from spectrum.invariants import check_invariants
 from spectrum.logging import record_execution
 
 
-def execute(engine: str, state: Mapping[str, Any], fn) -> Any:
+def execute(engine: str, state: Mapping[str, Any], fn, sink=None) -> Any:
     """
     Execute a deterministic function under invariant enforcement.
+
+    If given, `sink` (e.g. an ExecutionLog) receives the record via append().
     """
     invariant_results = check_invariants(state)
     if not all(invariant_results.values()):
@@ -25,4 +33,27 @@ def execute(engine: str, state: Mapping[str, Any], fn) -> Any:
         invariants=invariant_results,
     )
 
+    if sink is not None:
+        sink.append(record)
+
     return record
+
+
+def execute_batch(
+    engine: str,
+    states: Iterable[Mapping[str, Any]],
+    fn,
+    *,
+    workers: Optional[int] = None,
+    sink=None,
+) -> ExecutionBatch:
+    """
+    Execute fn over many states under invariant enforcement.
+
+    All invariants are checked before fn runs on any state. With workers > 1
+    fn is evaluated in a process pool; records keep input order either way.
+    """
+    states = tuple(states)
+    invariant_results = check_batch_invariants(states)
+    outputs = map_states(fn, states, workers)
+    return record_batch(engine, states, outputs, invariant_results, sink)
@@ -6,11 +6,15 @@ This module defines which engines exist and enforces version sealing.
 from spectrum.engines.registry import (
     EngineSpec,
     ENGINE_REGISTRY,
+    clear_code_hash_cache,
+    code_hash_cache_info,
     get_engine_spec,
 )
 
 __all__ = [
     "EngineSpec",
     "ENGINE_REGISTRY",
+    "clear_code_hash_cache",
+    "code_hash_cache_info",
     "get_engine_spec",
 ]
@@ -7,8 +7,9 @@ Rules:
 - Engine identity is (name, version, code_hash)
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, NamedTuple, Tuple
 import hashlib
 import inspect
 
@@ -21,11 +22,68 @@ class EngineSpec:
     description: str
 
 
-def _hash_callable(fn) -> str:
+def _hash_source(fn) -> str:
     src = inspect.getsource(fn).encode("utf-8")
     return hashlib.sha256(src).hexdigest()
 
 
+class CodeHashCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+CODE_HASH_CACHE_SIZE = 1024
+
+# (code object, source file) -> source hash, least recently used first
+_CODE_HASHES: "OrderedDict[Tuple[object, str], str]" = OrderedDict()
+_CODE_HASH_STATS = [0, 0]
+
+
+def _hash_callable(fn) -> str:
+    """
+    Source hash of fn, cached per code identity.
+
+    The key is the code object (bytecode, constants, names, first line)
+    and its source file, so reassigning __code__ forces a re-read, while
+    re-created functions with the same code share one entry. Source is
+    read once per code object per process; no syscall on a hit. At most
+    CODE_HASH_CACHE_SIZE entries are kept. Callables without a code
+    object are hashed uncached.
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return _hash_source(fn)
+
+    key = (code, code.co_filename)
+    digest = _CODE_HASHES.get(key)
+    if digest is not None:
+        _CODE_HASH_STATS[0] += 1
+        _CODE_HASHES.move_to_end(key)
+        return digest
+
+    _CODE_HASH_STATS[1] += 1
+    digest = _hash_source(fn)
+    while _CODE_HASHES and len(_CODE_HASHES) >= CODE_HASH_CACHE_SIZE:
+        _CODE_HASHES.popitem(last=False)
+    _CODE_HASHES[key] = digest
+    return digest
+
+
+def code_hash_cache_info() -> CodeHashCacheInfo:
+    return CodeHashCacheInfo(
+        hits=_CODE_HASH_STATS[0],
+        misses=_CODE_HASH_STATS[1],
+        currsize=len(_CODE_HASHES),
+    )
+
+
+def clear_code_hash_cache() -> None:
+    _CODE_HASHES.clear()
+    _CODE_HASH_STATS[0] = 0
+    _CODE_HASH_STATS[1] = 0
+
+
 # --- Canonical engine registry ---
 ENGINE_REGISTRY: Dict[str, EngineSpec] = {}
 
@@ -2,8 +2,9 @@
 Deterministic expansion rules for lattice growth.
 """
 
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from fractions import Fraction
+from spectrum.lattice.intern import InternTable
 from spectrum.lattice.node import LatticeNode
 
 
@@ -11,11 +12,15 @@ def apply_rule_add_constant(
     node: LatticeNode,
     constant: Fraction,
     next_id: int,
+    table: Optional[InternTable] = None,
 ) -> LatticeNode:
     """
     Deterministically add a constant to all state components.
+    With an InternTable, equal resulting states share one vector.
     """
     new_state = tuple(x + constant for x in node.state_vector)
+    if table is not None:
+        new_state = table.state(new_state)
 
     return LatticeNode(
         id=next_id,
@@ -26,13 +31,67 @@ def apply_rule_add_constant(
     )
 
 
+def merge_equivalent_nodes(
+    children: Iterable[LatticeNode],
+    renumber_from: Optional[int] = None,
+) -> Tuple[Tuple[LatticeNode, ...], int]:
+    """
+    Merge nodes with equal state vectors, via a hash index over states.
+
+    Input is taken in canonical (id) order. Each group becomes one node
+    carrying the first member's id, rule and hash, and the union of the
+    group's parents. With renumber_from, merged nodes are instead given
+    consecutive ids from that value. Returns (nodes, collapsed count).
+    """
+    ordered = sorted(children, key=lambda n: n.id)
+    index: Dict[Tuple, int] = {}
+    groups: List[Tuple[LatticeNode, set]] = []
+
+    for n in ordered:
+        slot = index.get(n.state_vector)
+        if slot is None:
+            index[n.state_vector] = len(groups)
+            groups.append((n, set(n.parents)))
+        else:
+            groups[slot][1].update(n.parents)
+
+    merged = tuple(
+        LatticeNode(
+            id=first.id if renumber_from is None else renumber_from + k,
+            state_vector=first.state_vector,
+            parents=parents,
+            transition_rule=first.transition_rule,
+            causal_input_hash=first.causal_input_hash,
+        )
+        for k, (first, parents) in enumerate(groups)
+    )
+    return merged, len(ordered) - len(merged)
+
+
+def merge_layer(children: Iterable[LatticeNode]) -> Tuple[Tuple[LatticeNode, ...], int]:
+    """
+    Canonical dedup of one expanded layer, shared by every dedup path:
+    merge_equivalent_nodes with merged nodes numbered consecutively from
+    the smallest child id. Returns (nodes, collapsed count).
+    """
+    children = tuple(children)
+    if not children:
+        return (), 0
+    start = min(n.id for n in children)
+    return merge_equivalent_nodes(children, renumber_from=start)
+
+
 def expand_deterministically(
     nodes: Iterable[LatticeNode],
     constant: Fraction,
+    *,
+    table: Optional[InternTable] = None,
 ) -> Tuple[LatticeNode, ...]:
     """
     Expand lattice by applying a single deterministic rule
     to all nodes in canonical order.
+
+    With an InternTable, child states are interned in it.
     """
     sorted_nodes = sorted(nodes, key=lambda n: n.id)
     max_id = max(n.id for n in sorted_nodes)
@@ -43,7 +102,58 @@ def expand_deterministically(
             node=node,
             constant=constant,
             next_id=max_id + offset,
+            table=table,
         )
         children.append(child)
 
     return tuple(children)
+
+
+def expand_deterministically_dedup(
+    nodes: Iterable[LatticeNode],
+    constant: Fraction,
+    *,
+    table: Optional[InternTable] = None,
+) -> Tuple[Tuple[LatticeNode, ...], int]:
+    """
+    expand_deterministically, then merge children with equal states (see
+    merge_layer).
+
+    Returns (children, collapsed); merged children are numbered
+    consecutively from max_id + 1.
+    """
+    return merge_layer(expand_deterministically(nodes, constant, table=table))
+
+
+def expand_deterministically_vectorized(
+    nodes: Iterable[LatticeNode],
+    constant: Fraction,
+) -> Tuple[LatticeNode, ...]:
+    """
+    expand_deterministically with the add(constant) rule applied to the
+    whole layer at once as a RationalVector. Output is identical; layers
+    of mixed dimension fall back to the per-node rule.
+
+    Equal components share one Fraction; whole states are not interned.
+    """
+    from spectrum.rational.vector import RationalVector  # requires NumPy
+
+    sorted_nodes = sorted(nodes, key=lambda n: n.id)
+    dims = {len(n.state_vector) for n in sorted_nodes}
+    if len(dims) != 1:
+        return expand_deterministically(sorted_nodes, constant)
+
+    max_id = sorted_nodes[-1].id
+    layer = RationalVector.from_states([n.state_vector for n in sorted_nodes])
+    states = (layer + constant).to_tuples()
+
+    return tuple(
+        LatticeNode(
+            id=max_id + offset,
+            state_vector=state,
+            parents={node.id},
+            transition_rule=f"add({constant})",
+            causal_input_hash=b"",
+        )
+        for offset, (node, state) in enumerate(zip(sorted_nodes, states), start=1)
+    )
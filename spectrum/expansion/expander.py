@@ -0,0 +1,150 @@
+"""
+Lazy multi-step lattice expansion.
+
+Rules:
+- Layers are produced one at a time; only the current layer is held
+- Output depends only on the seed and the rule
+- Timing counters are reported, never fed back into expansion
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Callable, Iterator, Iterable, List, Optional, Tuple
+import os
+import time
+from spectrum.expand.rules import expand_deterministically, merge_layer
+from spectrum.expansion.rules import expand_layer
+from spectrum.lattice.node import LatticeNode
+from spectrum.serialization.canonical import write_nodes
+
+Layer = Tuple[LatticeNode, ...]
+Rule = Callable[[Layer], Layer]
+
+
+def append_rule(layer: Layer) -> Layer:
+    """
+    Append rule from expansion.rules: each child appends (1,).
+    """
+    return expand_layer(layer)
+
+
+def add_constant_rule(constant: Fraction) -> Rule:
+    """
+    add(constant) rule from expand.rules: children are numbered after
+    the largest id of their layer.
+    """
+    def rule(layer: Layer) -> Layer:
+        return expand_deterministically(layer, constant)
+    return rule
+
+
+@dataclass(frozen=True)
+class LayerStats:
+    """
+    Counters for one produced layer.
+
+      - depth:      0 for the seed layer
+      - size:       number of nodes
+      - elapsed_ns: time spent expanding (0 for the seed)
+      - path:       spill file, if spilling is enabled
+      - digest:     hash_nodes of the layer, if spilled
+      - collapsed:  children merged away by deduplication
+    """
+
+    depth: int
+    size: int
+    elapsed_ns: int
+    path: Optional[str] = None
+    digest: Optional[str] = None
+    collapsed: int = 0
+
+
+class LatticeExpander:
+    """
+    Iterable of canonical (id-sorted) layers, starting with the seed.
+
+    Iteration stops after `max_depth` expansions, before a layer that
+    would take the total node count past `max_nodes`, or when a layer is
+    empty. With `spill_dir`, every yielded layer is first written there
+    as layer-NNNNNN.txt in canonical form, so callers can drop it.
+
+    With `dedup`, children with equal states are merged after each step
+    (parents unioned, ids renumbered as in expand.rules.merge_layer), so
+    redundant states do not multiply across layers and layers match the
+    *_dedup expansion functions.
+    """
+
+    def __init__(
+        self,
+        seed: Iterable[LatticeNode],
+        rule: Rule = append_rule,
+        *,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        dedup: bool = False,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must be >= 0")
+        if max_nodes is not None and max_nodes < 0:
+            raise ValueError("max_nodes must be >= 0")
+
+        self._seed = tuple(sorted(seed, key=lambda n: n.id))
+        self._rule = rule
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self._spill_dir = spill_dir
+        self._dedup = dedup
+        self._clock = clock
+        self.stats: List[LayerStats] = []
+
+    @property
+    def total_nodes(self) -> int:
+        return sum(s.size for s in self.stats)
+
+    def _spill(self, depth: int, layer: Layer) -> Tuple[Optional[str], Optional[str]]:
+        if self._spill_dir is None:
+            return None, None
+        os.makedirs(self._spill_dir, exist_ok=True)
+        path = os.path.join(self._spill_dir, f"layer-{depth:06d}.txt")
+        with open(path, "wb") as fp:
+            digest = write_nodes(layer, fp, presorted=True)
+        return path, digest
+
+    def _emit(self, depth: int, layer: Layer, elapsed_ns: int, collapsed: int = 0) -> bool:
+        if self._max_nodes is not None and self.total_nodes + len(layer) > self._max_nodes:
+            return False
+        path, digest = self._spill(depth, layer)
+        self.stats.append(
+            LayerStats(depth, len(layer), elapsed_ns, path, digest, collapsed)
+        )
+        return True
+
+    def __iter__(self) -> Iterator[Layer]:
+        self.stats = []
+        layer = self._seed
+        if not self._emit(0, layer, 0):
+            return
+        yield layer
+
+        depth = 0
+        while layer and (self._max_depth is None or depth < self._max_depth):
+            start = self._clock()
+            layer = tuple(sorted(self._rule(layer), key=lambda n: n.id))
+            collapsed = 0
+            if self._dedup:
+                layer, collapsed = merge_layer(layer)
+            elapsed = self._clock() - start
+            depth += 1
+            if not layer or not self._emit(depth, layer, elapsed, collapsed):
+                return
+            yield layer
+
+
+__all__ = [
+    "LatticeExpander",
+    "LayerStats",
+    "add_constant_rule",
+    "append_rule",
+]
@@ -0,0 +1,114 @@
+"""
+Multi-process layer expansion.
+
+Rules:
+- Output is identical to the serial expansion for every worker count
+- Child ids are assigned from the canonical input order, never from
+  scheduling order
+
+The layer is stably sorted by id once and split into contiguous id
+ranges, one per worker. Each partition knows its offset in the sorted
+layer (a prefix sum over partition sizes), so it can assign child ids
+on its own; concatenating the partitions in order gives the canonical
+output without a final sort.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import Iterable, List, Sequence, Tuple
+from spectrum.expand.rules import apply_rule_add_constant
+from spectrum.expansion.rules import expand_node
+from spectrum.lattice.node import LatticeNode
+
+
+def _partition(nodes: Sequence[LatticeNode], parts: int) -> List[Tuple[int, Sequence[LatticeNode]]]:
+    """
+    (offset, slice) pairs covering `nodes` in order with near-equal sizes.
+    """
+    bounds = [len(nodes) * k // parts for k in range(parts + 1)]
+    return [
+        (start, nodes[start:end])
+        for start, end in zip(bounds, bounds[1:])
+        if end > start
+    ]
+
+
+def _expand_partition(nodes: Sequence[LatticeNode]) -> Tuple[LatticeNode, ...]:
+    # Child ids (2 * id + 1) are monotone in the parent id, so children of
+    # an id-sorted partition are already in canonical order.
+    children = []
+    for n in nodes:
+        children.extend(expand_node(n))
+    return tuple(children)
+
+
+def _add_constant_partition(
+    nodes: Sequence[LatticeNode],
+    constant: Fraction,
+    first_id: int,
+) -> Tuple[LatticeNode, ...]:
+    return tuple(
+        apply_rule_add_constant(node=n, constant=constant, next_id=first_id + i)
+        for i, n in enumerate(nodes)
+    )
+
+
+def _map(fn, workers: int, *iterables) -> List[Tuple[LatticeNode, ...]]:
+    if workers == 1:
+        return list(map(fn, *iterables))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *iterables))
+
+
+def _concat(chunks: Iterable[Tuple[LatticeNode, ...]]) -> Tuple[LatticeNode, ...]:
+    out: List[LatticeNode] = []
+    for chunk in chunks:
+        out.extend(chunk)
+    return tuple(out)
+
+
+def expand_layer_parallel(
+    nodes: Iterable[LatticeNode],
+    workers: int = 1,
+) -> Tuple[LatticeNode, ...]:
+    """
+    Parallel equivalent of expansion.rules.expand_layer.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    ordered = sorted(nodes, key=lambda n: n.id)
+    partitions = _partition(ordered, workers)
+    return _concat(_map(_expand_partition, workers, [p for _, p in partitions]))
+
+
+def expand_deterministically_parallel(
+    nodes: Iterable[LatticeNode],
+    constant: Fraction,
+    workers: int = 1,
+) -> Tuple[LatticeNode, ...]:
+    """
+    Parallel equivalent of expand.rules.expand_deterministically.
+
+    The child of the node at position i of the sorted layer gets id
+    max_id + 1 + i; each partition starts at max_id + 1 + its offset.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    ordered = sorted(nodes, key=lambda n: n.id)
+    if not ordered:
+        raise ValueError("cannot expand an empty layer")
+    base = ordered[-1].id + 1
+
+    partitions = _partition(ordered, workers)
+    return _concat(_map(
+        _add_constant_partition,
+        workers,
+        [p for _, p in partitions],
+        [constant] * len(partitions),
+        [base + offset for offset, _ in partitions],
+    ))
+
+
+__all__ = ["expand_deterministically_parallel", "expand_layer_parallel"]
@@ -10,20 +10,38 @@ Rules:
 """
 
 from fractions import Fraction
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
+from spectrum.expand.rules import merge_layer
+from spectrum.lattice.intern import InternTable
 from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.pvector import PersistentVector
+from spectrum.lattice.store import LatticeStore
 
+_ONE = Fraction(1)
 
-def expand_node(node: LatticeNode) -> Tuple[LatticeNode, ...]:
+
+def expand_node(
+    node: LatticeNode,
+    table: Optional[InternTable] = None,
+) -> Tuple[LatticeNode, ...]:
     """
     Canonical deterministic expansion:
     - Each node expands into exactly one child
-    - Child state = state_vector + (1,)
+    - Child state = state_vector + (1,), of the same type as the parent's
+    - PersistentVector states share the parent's prefix; with an
+      InternTable, child states are interned PersistentVectors and equal
+      child states are one object
     - Parent relationship preserved deterministically
     """
 
     next_id = node.id * 2 + 1  # canonical, collision-free
-    next_state = node.state_vector + (Fraction(1),)
+    state = node.state_vector
+    if table is not None:
+        next_state = table.append(table.vector(state), _ONE)
+    elif isinstance(state, PersistentVector):
+        next_state = state.append(_ONE)
+    else:
+        next_state = state + (_ONE,)
 
     child = LatticeNode(
         id=next_id,
@@ -34,7 +52,11 @@ def expand_node(node: LatticeNode) -> Tuple[LatticeNode, ...]:
     return (child,)
 
 
-def expand_layer(nodes: Iterable[LatticeNode]) -> Tuple[LatticeNode, ...]:
+def expand_layer(
+    nodes: Iterable[LatticeNode],
+    *,
+    table: Optional[InternTable] = None,
+) -> Tuple[LatticeNode, ...]:
     """
     Deterministic layer expansion.
     Output is sorted by node id for canonical ordering.
@@ -42,6 +64,51 @@ def expand_layer(nodes: Iterable[LatticeNode]) -> Tuple[LatticeNode, ...]:
 
     expanded = []
     for n in nodes:
-        expanded.extend(expand_node(n))
+        expanded.extend(expand_node(n, table))
 
     return tuple(sorted(expanded, key=lambda n: n.id))
+
+
+def expand_layer_dedup(
+    nodes: Iterable[LatticeNode],
+    *,
+    table: Optional[InternTable] = None,
+) -> Tuple[Tuple[LatticeNode, ...], int]:
+    """
+    expand_layer, then merge children with equal states (see
+    expand.rules.merge_layer).
+
+    Returns (children, collapsed); merged children are numbered
+    consecutively from the smallest child id.
+    """
+    return merge_layer(expand_layer(nodes, table=table))
+
+
+def expand_store(store: LatticeStore) -> LatticeStore:
+    """
+    Columnar equivalent of expand_layer.
+
+    Children are appended in id order and reuse the parent's interned
+    state values, so no Fraction objects are created.
+    """
+
+    out = LatticeStore()
+    one = out.intern_value(Fraction(1))
+    remap = {}
+
+    for row in store.canonical_rows():
+        indices = []
+        for idx in store.state_indices(row):
+            mapped = remap.get(idx)
+            if mapped is None:
+                mapped = out.intern_value(
+                    Fraction(store.numerators[idx], store.denominators[idx])
+                )
+                remap[idx] = mapped
+            indices.append(mapped)
+        indices.append(one)
+
+        node_id = store.ids[row]
+        out.append_indexed(node_id * 2 + 1, indices, (node_id,))
+
+    return out
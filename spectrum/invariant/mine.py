@@ -1,46 +1,83 @@
 """
 Invariant mining for the Spectrum deterministic framework.
+
+States are transposed once into per-dimension columns of exact
+(numerator, denominator) pairs; each column miner then runs over the
+columns in O(n * d). States with components that are not rationals
+(floats, other hashables) use single-part columns of the raw values,
+compared by ==. A column holding a value unequal to itself (NaN) is
+None: it is neither constant nor equal to any other column.
 """
 
 from __future__ import annotations
-from typing import Iterable, Set, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
 from fractions import Fraction
 from spectrum.invariants.core import Invariant
 
+# (numerators, denominators) for rational states, (values,) otherwise;
+# None for a column holding a value unequal to itself.
+Column = Optional[Tuple[Tuple, ...]]
+ColumnMiner = Callable[[Sequence[Tuple], Sequence[Column]], Iterable[Invariant]]
+
+
+def _columns(states: Sequence[Tuple]) -> List[Column]:
+    dim = len(states[0])
+    values = list(zip(*states))
+    if len(values) < dim:
+        raise IndexError("state dimension mismatch")
+    try:
+        return [
+            (
+                tuple(x.numerator for x in col),
+                tuple(x.denominator for x in col),
+            )
+            for col in values[:dim]
+        ]
+    except AttributeError:
+        return [
+            (col,) if all(x == x for x in col) else None
+            for col in values[:dim]
+        ]
+
+
+def _mine_constants(states, columns):
+    for i, column in enumerate(columns):
+        if column is None:
+            continue
+        if all(part.count(part[0]) == len(part) for part in column):
+            yield Invariant(("const", (i,), (states[0][i],)))
+
+
+def _mine_equalities(states, columns):
+    groups = {}
+    for i, column in enumerate(columns):
+        if column is not None:
+            groups.setdefault(column, []).append(i)
+    for members in groups.values():
+        for a, i in enumerate(members):
+            for j in members[a + 1:]:
+                yield Invariant(("equal", (i, j), ()))
+
+
+# Extension point: further miners (e.g. linear relations) take the states
+# and their columns and yield Invariant tuples.
+COLUMN_MINERS: List[ColumnMiner] = [
+    _mine_constants,
+    _mine_equalities,
+]
+
 
 def mine(states: Iterable[Tuple[Fraction, ...]]) -> Set[Invariant]:
     states = tuple(states)
     if not states:
         return set()
 
-    dim = len(states[0])
+    columns = _columns(states)
     invariants: set[Invariant] = set()
-
-    # Constant invariants
-    for i in range(dim):
-        values = {s[i] for s in states}
-        if len(values) == 1:
-            invariants.add(
-                Invariant((
-                    "const",
-                    (i,),
-                    (values.pop(),),
-                ))
-            )
-
-    # Equality invariants
-    for i in range(dim):
-        for j in range(i + 1, dim):
-            if all(s[i] == s[j] for s in states):
-                invariants.add(
-                    Invariant((
-                        "equal",
-                        (i, j),
-                        (),
-                    ))
-                )
+    for miner in COLUMN_MINERS:
+        invariants.update(miner(states, columns))
 
     return invariants
 
 
-__all__ = ["mine"]
+__all__ = ["COLUMN_MINERS", "mine"]
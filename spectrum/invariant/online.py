@@ -0,0 +1,119 @@
+"""
+Online invariant mining over unbounded state streams.
+
+Candidate invariants only ever shrink: every state can falsify
+candidates but never create new ones, so each update costs O(d).
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List, Set, Tuple
+from fractions import Fraction
+from spectrum.invariants.core import Invariant
+
+Checkpoint = Tuple[int, Tuple[Fraction, ...], Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+
+
+def _key(x):
+    """
+    Grouping key with key(a) == key(b) exactly when a == b, so classes
+    match mine() on mixed int/float/Fraction states.
+    """
+    try:
+        return (x.numerator, x.denominator)
+    except AttributeError:
+        pass
+    if x != x:  # NaN equals nothing, itself included
+        return object()
+    try:
+        return x.as_integer_ratio()
+    except (AttributeError, OverflowError):
+        return x
+
+
+class OnlineInvariantMiner:
+    """
+    Incremental equivalent of spectrum.invariant.mine.mine.
+
+    After feeding states s1..sn, invariants() equals mine((s1, ..., sn)).
+    Candidates are kept as:
+      - const:   dimensions still equal to the first state's value
+      - classes: partition of dimensions that have been equal in every
+                 state so far (singleton classes are dropped)
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._reference: Tuple[Fraction, ...] = ()
+        self._const: List[int] = []
+        self._classes: List[Tuple[int, ...]] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, state: Tuple[Fraction, ...]) -> None:
+        if self._count == 0:
+            self._reference = tuple(state)
+            self._const = [i for i, x in enumerate(state) if x == x]
+            self._classes = self._split(tuple(range(len(state))), state)
+            self._count = 1
+            return
+
+        if len(state) < len(self._reference):
+            raise IndexError("state dimension mismatch")
+
+        ref = self._reference
+        self._const = [i for i in self._const if state[i] == ref[i]]
+
+        classes: List[Tuple[int, ...]] = []
+        for members in self._classes:
+            classes.extend(self._split(members, state))
+        self._classes = classes
+        self._count += 1
+
+    def update_many(self, states: Iterable[Tuple[Fraction, ...]]) -> None:
+        for state in states:
+            self.update(state)
+
+    @staticmethod
+    def _split(members: Tuple[int, ...], state) -> List[Tuple[int, ...]]:
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for i in members:
+            groups.setdefault(_key(state[i]), []).append(i)
+        return [tuple(g) for g in groups.values() if len(g) > 1]
+
+    def invariants(self) -> Set[Invariant]:
+        """
+        Invariants holding on every state seen so far.
+        """
+        invariants: Set[Invariant] = set()
+        for i in self._const:
+            invariants.add(Invariant(("const", (i,), (self._reference[i],))))
+        for members in self._classes:
+            for a, i in enumerate(members):
+                for j in members[a + 1:]:
+                    invariants.add(Invariant(("equal", (i, j), ())))
+        return invariants
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Immutable snapshot from which mining can be resumed.
+        """
+        return (
+            self._count,
+            self._reference,
+            tuple(self._const),
+            tuple(self._classes),
+        )
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Checkpoint) -> "OnlineInvariantMiner":
+        count, reference, const, classes = checkpoint
+        miner = cls()
+        miner._count = count
+        miner._reference = tuple(reference)
+        miner._const = list(const)
+        miner._classes = [tuple(c) for c in classes]
+        return miner
+
+
+__all__ = ["OnlineInvariantMiner"]
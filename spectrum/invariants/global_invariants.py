@@ -5,43 +5,154 @@ All invariants must be:
 - Deterministic
 - Order-independent
 - Environment-independent
+
+All checks are iterative and O(V + E); input is consumed exactly once,
+so generators are safe.
 """
 
-from typing import Iterable
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Set, Tuple, Union
 from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.store import LatticeStore
 
+Nodes = Union[Iterable[LatticeNode], LatticeStore]
 
-def unique_node_ids(nodes: Iterable[LatticeNode]) -> bool:
-    ids = [n.id for n in nodes]
-    return len(ids) == len(set(ids))
 
+@dataclass(frozen=True)
+class GlobalInvariantReport:
+    """
+    Offending node ids per invariant, each in ascending order.
 
-def no_orphan_nodes(nodes: Iterable[LatticeNode]) -> bool:
-    node_ids = {n.id for n in nodes}
-    for n in nodes:
-        for p in n.parents:
-            if p not in node_ids:
-                return False
-    return True
+      - duplicate_ids: ids carried by more than one node
+      - orphan_ids:    nodes with at least one parent outside the node set
+      - cyclic_ids:    nodes on a parent cycle (or on a path between cycles)
+    """
+
+    duplicate_ids: Tuple[int, ...]
+    orphan_ids: Tuple[int, ...]
+    cyclic_ids: Tuple[int, ...]
+
+    @property
+    def ok(self) -> bool:
+        return not (self.duplicate_ids or self.orphan_ids or self.cyclic_ids)
+
+
+def _iter_edges(nodes: Nodes) -> Iterator[Tuple[int, Iterable[int]]]:
+    """
+    (node_id, parent_ids) pairs, read straight from the columns of a store.
+    """
+    if isinstance(nodes, LatticeStore):
+        return nodes.iter_edges()
+    return ((n.id, n.parents) for n in nodes)
+
+
+def _edges(nodes: Nodes) -> Tuple[Tuple[int, Iterable[int]], ...]:
+    return tuple(_iter_edges(nodes))
+
+
+def _cyclic_residue(graph: Dict[int, Set[int]]) -> Tuple[int, ...]:
+    """
+    Ids that lie on a cycle of the parent graph.
+
+    Kahn's algorithm peels every node whose parents are all resolved; the
+    remainder is then peeled from the other side (nodes with no remaining
+    children) so that only cycle members are reported. Parents outside the
+    graph are treated as resolved.
+    """
+    pending: Dict[int, int] = {}
+    children: Dict[int, List[int]] = {}
+    for nid, parents in graph.items():
+        count = 0
+        for p in parents:
+            if p in graph:
+                count += 1
+                children.setdefault(p, []).append(nid)
+        pending[nid] = count
 
+    ready = [nid for nid, count in pending.items() if count == 0]
+    while ready:
+        nid = ready.pop()
+        del pending[nid]
+        for c in children.get(nid, ()):
+            pending[c] -= 1
+            if pending[c] == 0:
+                ready.append(c)
 
-def parents_are_acyclic(nodes: Iterable[LatticeNode]) -> bool:
-    graph = {n.id: set(n.parents) for n in nodes}
+    if not pending:
+        return ()
 
-    visited = set()
-    stack = set()
+    remaining = {
+        nid: sum(1 for c in children.get(nid, ()) if c in pending)
+        for nid in pending
+    }
+    ready = [nid for nid, count in remaining.items() if count == 0]
+    while ready:
+        nid = ready.pop()
+        del remaining[nid]
+        for p in graph[nid]:
+            if p in remaining:
+                remaining[p] -= 1
+                if remaining[p] == 0:
+                    ready.append(p)
 
-    def visit(nid):
-        if nid in stack:
-            return False
-        if nid in visited:
-            return True
-        stack.add(nid)
-        for p in graph.get(nid, []):
-            if not visit(p):
+    return tuple(sorted(remaining))
+
+
+def check_global_invariants(
+    nodes: Nodes,
+    known_ids: AbstractSet[int] = frozenset(),
+) -> GlobalInvariantReport:
+    """
+    Evaluate all global invariants in a single pass over the node set.
+
+    known_ids are ids of an already-verified lattice the nodes extend:
+    they count as valid parents and as taken ids. Because a verified
+    lattice cannot reference the new nodes, cycles can only form among
+    the new nodes, so the cost is O(V + E) of `nodes` alone.
+    """
+    graph: Dict[int, Set[int]] = {}
+    duplicates: Set[int] = set()
+    for nid, parents in _iter_edges(nodes):
+        if nid in graph:
+            duplicates.add(nid)
+            graph[nid].update(parents)
+        else:
+            if nid in known_ids:
+                duplicates.add(nid)
+            graph[nid] = set(parents)
+
+    orphans = [
+        nid for nid, parents in graph.items()
+        if any(p not in graph and p not in known_ids for p in parents)
+    ]
+
+    return GlobalInvariantReport(
+        duplicate_ids=tuple(sorted(duplicates)),
+        orphan_ids=tuple(sorted(orphans)),
+        cyclic_ids=_cyclic_residue(graph),
+    )
+
+
+def unique_node_ids(nodes: Nodes) -> bool:
+    if isinstance(nodes, LatticeStore):
+        ids = nodes.ids
+    else:
+        ids = [n.id for n in nodes]
+    return len(ids) == len(set(ids))
+
+
+def no_orphan_nodes(nodes: Nodes) -> bool:
+    edges = _edges(nodes)
+    node_ids = {nid for nid, _ in edges}
+    for _, parents in edges:
+        for p in parents:
+            if p not in node_ids:
                 return False
-        stack.remove(nid)
-        visited.add(nid)
-        return True
+    return True
+
 
-    return all(visit(n.id) for n in nodes)
+def parents_are_acyclic(nodes: Nodes) -> bool:
+    graph: Dict[int, Set[int]] = {}
+    for nid, parents in _iter_edges(nodes):
+        graph.setdefault(nid, set()).update(parents)
+    return not _cyclic_residue(graph)
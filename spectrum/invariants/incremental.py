@@ -0,0 +1,121 @@
+"""
+Incremental verification of append-only lattices.
+
+All checks must be:
+- Deterministic
+- Proportional to the appended layer, not the whole lattice
+"""
+
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from spectrum.lattice.node import LatticeNode
+from spectrum.invariants.global_invariants import (
+    GlobalInvariantReport,
+    check_global_invariants,
+)
+from spectrum.invariants.proof import run_proofs_incremental
+
+
+class NodeView(Sequence[LatticeNode]):
+    """
+    Read-only, live view of a verifier's committed nodes.
+    """
+
+    __slots__ = ("_nodes",)
+
+    def __init__(self, nodes: List[LatticeNode]) -> None:
+        self._nodes = nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._nodes[index])
+        return self._nodes[index]
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"NodeView({len(self._nodes)} nodes)"
+
+
+class IncrementalLatticeVerifier:
+    """
+    Verified lattice that grows by whole layers.
+
+    The id index persists across calls, so each appended layer is checked
+    for uniqueness, orphan-freedom and acyclicity in O(|delta|). A layer is
+    committed only if every invariant and every registered proof passes.
+    """
+
+    def __init__(self, nodes: Iterable[LatticeNode] = ()) -> None:
+        self._ids: Set[int] = set()
+        self._nodes: List[LatticeNode] = []
+        self._view = NodeView(self._nodes)
+        # Committed nodes as a tuple, for proofs without an incremental
+        # hook; extended in place of being rebuilt on each append.
+        self._snapshot: Optional[Tuple[LatticeNode, ...]] = ()
+        self._pending: Optional[Tuple[Tuple[LatticeNode, ...], Tuple[LatticeNode, ...]]] = None
+        if not self.append(nodes):
+            raise ValueError("initial lattice violates global invariants")
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self._ids
+
+    @property
+    def nodes(self) -> NodeView:
+        """
+        Committed nodes, as a read-only view (no copy).
+        """
+        return self._view
+
+    def extended(self, delta: Tuple[LatticeNode, ...]) -> Tuple[LatticeNode, ...]:
+        """
+        Committed nodes followed by `delta`, as a tuple.
+
+        The committed tuple is cached between appends, and the result is
+        kept so that committing `delta` reuses it instead of copying.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._nodes)
+        full = self._snapshot + delta
+        self._pending = (delta, full)
+        return full
+
+    def check(self, delta: Iterable[LatticeNode]) -> GlobalInvariantReport:
+        """
+        Report invariant violations of `delta` against the committed lattice.
+        Does not modify the verifier.
+        """
+        return check_global_invariants(delta, self._ids)
+
+    def append(self, delta: Iterable[LatticeNode]) -> bool:
+        """
+        Verify and commit `delta`. Returns False (and commits nothing)
+        if any invariant or proof fails.
+        """
+        delta = tuple(delta)
+        if not delta:
+            return True
+        if not check_global_invariants(delta, self._ids).ok:
+            return False
+        self._pending = None
+        if not run_proofs_incremental(self, delta):
+            self._pending = None
+            return False
+
+        self._ids.update(n.id for n in delta)
+        self._nodes.extend(delta)
+        pending, self._pending = self._pending, None
+        if pending is not None and pending[0] is delta:
+            self._snapshot = pending[1]
+        else:
+            self._snapshot = None
+        return True
+
+
+__all__ = ["IncrementalLatticeVerifier", "NodeView"]
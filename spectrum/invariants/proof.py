@@ -1,17 +1,29 @@
-from typing import Iterable, Callable, Dict
+from typing import Any, Iterable, Callable, Dict, Optional, Tuple
 from spectrum.lattice.node import LatticeNode
 
 Proof = Callable[[Iterable[LatticeNode]], bool]
+IncrementalProof = Callable[[Any, Tuple[LatticeNode, ...]], bool]
 
 _PROOFS: Dict[str, Proof] = {}
+_INCREMENTAL_PROOFS: Dict[str, IncrementalProof] = {}
 
-def register_proof(name: str, proof: Proof) -> None:
+def register_proof(
+    name: str,
+    proof: Proof,
+    incremental: Optional[IncrementalProof] = None,
+) -> None:
     """
     Register a deterministic proof obligation.
+
+    A proof may opt in to incremental checking by also supplying
+    `incremental(state, delta)`, where `state` exposes the already-verified
+    nodes (see IncrementalLatticeVerifier) and `delta` is the appended layer.
     """
     if name in _PROOFS:
         raise ValueError(f"Proof '{name}' already registered")
     _PROOFS[name] = proof
+    if incremental is not None:
+        _INCREMENTAL_PROOFS[name] = incremental
 
 def run_proofs(nodes: Iterable[LatticeNode]) -> bool:
     """
@@ -22,5 +34,28 @@ def run_proofs(nodes: Iterable[LatticeNode]) -> bool:
             return False
     return True
 
+def run_proofs_incremental(state: Any, delta: Iterable[LatticeNode]) -> bool:
+    """
+    All registered proofs must pass on `state.nodes` extended by `delta`.
+
+    Incremental proofs see only (state, delta); the others fall back to
+    the full node set, which is built at most once, by
+    `state.extended(delta)` when the state provides it.
+    """
+    delta = tuple(delta)
+    full = None
+    for name, proof in _PROOFS.items():
+        incremental = _INCREMENTAL_PROOFS.get(name)
+        if incremental is not None:
+            if not incremental(state, delta):
+                return False
+            continue
+        if full is None:
+            extended = getattr(state, "extended", None)
+            full = extended(delta) if extended is not None else tuple(state.nodes) + delta
+        if not proof(full):
+            return False
+    return True
+
 def list_proofs():
     return tuple(_PROOFS.keys())
@@ -1,6 +1,9 @@
 """
 Irreversibility‑classification layer for the Spectrum deterministic framework.
 Provides helpers to test entropy growth, replay stability, and irreversible transitions.
+
+entropy_shift / is_irreversible are float helpers kept for compatibility;
+exact batched classification lives in spectrum.irreversibility.entropy.
 """
 from __future__ import annotations
 import numpy as np
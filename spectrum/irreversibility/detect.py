@@ -1,31 +1,33 @@
 """
-Deterministic Irreversibility Detector — basic skeleton.
+Deterministic Irreversibility Detector.
 """
 
-import numpy as np
-from typing import Iterable, Tuple
+from typing import Iterable, Tuple, Union
 from dataclasses import dataclass
 from fractions import Fraction
-from .entropy_shift import entropy_shift  # Adjusted import
-from .is_irreversible import is_irreversible  # Adjusted import
+from spectrum.irreversibility.entropy import classify_irreversible
 
 @dataclass(frozen=True)
 class Transition:
-    """Immutable transition placeholder."""
+    """Immutable transition between two exact states."""
     parent_state: Tuple[Fraction, ...]
     child_state: Tuple[Fraction, ...]
 
+def _as_fraction(value: Union[Fraction, int, float, str]) -> Fraction:
+    # Floats are read through their shortest repr, so 0.01 means 1/100.
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return Fraction(value)
+
 def find_irreversible(
     transitions: Iterable[Transition],
-    threshold: float = 0.01,
-):
-    """Return the subset of transitions showing entropy increase > threshold."""
-    result = []
-    for t in transitions:
-        # Convert states to NumPy arrays to calculate entropy differences
-        before = np.array([float(x) for x in t.parent_state])
-        after = np.array([float(x) for x in t.child_state])
-        # Check irreversibility and append to result if above the threshold
-        if is_irreversible(before, after, threshold):
-            result.append(t)
-    return tuple(result)
+    threshold: Union[Fraction, int, float, str] = Fraction(1, 100),
+) -> Tuple[Transition, ...]:
+    """Return the subset of transitions showing entropy increase > threshold.
+
+    All transitions are classified in one batch with exact inputs and
+    fixed-point entropy (see spectrum.irreversibility.entropy).
+    """
+    transitions = tuple(transitions)
+    flags = classify_irreversible(transitions, _as_fraction(threshold))
+    return tuple(t for t, flag in zip(transitions, flags) if flag)
@@ -0,0 +1,77 @@
+"""
+Indexed irreversible-edge detection on lattice graphs.
+
+An edge parent -> child is irreversible when the child's state differs
+from its parent's. Results are always returned in canonical sorted order.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+from spectrum.lattice.node import LatticeNode
+
+Edge = Tuple[int, int]
+
+
+class IrreversibleEdgeIndex:
+    """
+    Persistent id index for lattices that grow by layers.
+
+    Each node's state is hashed once on insertion; edges compare hashes
+    first and fall back to full state comparison only on a hash match.
+    Children may arrive before their parents: such edges are held until
+    the parent is added. The first node added under an id is the one
+    indexed.
+    """
+
+    def __init__(self, nodes: Iterable[LatticeNode] = ()) -> None:
+        self._states: Dict[int, Tuple[int, Tuple]] = {}
+        self._pending: Dict[int, List[Tuple[int, int, Tuple]]] = {}
+        self._edges: Set[Edge] = set()
+        self.add(nodes)
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __contains__(self, edge: Edge) -> bool:
+        return edge in self._edges
+
+    def add(self, nodes: Iterable[LatticeNode]) -> Tuple[Edge, ...]:
+        """
+        Index new nodes; returns the irreversible edges they complete.
+        """
+        found: List[Edge] = []
+        states = self._states
+
+        for n in nodes:
+            if n.id in states:
+                continue
+            state = n.state_vector
+            key = (hash(state), state)
+            states[n.id] = key
+
+            for child_id, child_hash, child_state in self._pending.pop(n.id, ()):
+                if child_hash != key[0] or child_state != state:
+                    found.append((n.id, child_id))
+
+            for parent_id in n.parents:
+                parent = states.get(parent_id)
+                if parent is None:
+                    self._pending.setdefault(parent_id, []).append((n.id, key[0], state))
+                elif parent[0] != key[0] or parent[1] != state:
+                    found.append((parent_id, n.id))
+
+        found = sorted(set(found) - self._edges)
+        self._edges.update(found)
+        return tuple(found)
+
+    def edges(self) -> Tuple[Edge, ...]:
+        return tuple(sorted(self._edges))
+
+
+def find_irreversible_edges(nodes: Iterable[LatticeNode]) -> Tuple[Edge, ...]:
+    """
+    Irreversible parent -> child edges of a node set, sorted.
+    """
+    return IrreversibleEdgeIndex(nodes).edges()
+
+
+__all__ = ["IrreversibleEdgeIndex", "find_irreversible_edges"]
@@ -0,0 +1,256 @@
+"""
+Exact-input, fixed-point entropy for irreversibility classification.
+
+Rules:
+- No floating point: states are exact rationals, arithmetic is integer
+- Deterministic: results depend only on the input states
+- Bounded error: see LOG2_ERROR_BOUND and ENTROPY_ERROR_BOUND
+
+Each state is reduced to its canonical integer weights (common
+denominator cleared, common factor removed), so that
+
+    H = log2(A) - sum(w_i * log2(w_i)) / A,      A = sum(w_i)
+
+only needs log2 of positive integers. log2 is evaluated in fixed point
+with FRACTION_BITS fractional bits by repeated squaring of a 31-bit
+mantissa; every intermediate fits in int64, so whole batches are
+evaluated as NumPy integer arrays. Rows whose weight total does not fit
+the vectorized bound are evaluated with the same algorithm on Python
+ints, giving bit-identical results.
+
+Weight reduction is vectorized as well: rows whose denominators and
+numerators provably fit int64 are reduced with NumPy lcm/gcd. States
+with a negative component, or with no positive component, have no
+entropy; they are reported as None and never classified irreversible.
+"""
+
+from fractions import Fraction
+from math import gcd
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+FRACTION_BITS = 30
+_ONE = 1 << FRACTION_BITS
+_TWO = 2 << FRACTION_BITS
+
+# Largest weight total evaluated in int64: keeps sum(w_i * log2 w_i) < 2**62.
+_VECTOR_LIMIT = 1 << 26
+
+# |log2_fixed(w) / 2**FRACTION_BITS - log2(w)|, and the resulting bound on
+# an entropy difference: 2 * (2 * log2 error + 1 ulp of the division).
+LOG2_ERROR_BOUND = Fraction(4, _ONE)
+ENTROPY_ERROR_BOUND = 4 * LOG2_ERROR_BOUND + Fraction(2, _ONE)
+
+
+def state_weights(state: Sequence[Fraction]) -> Tuple[int, ...]:
+    """
+    Canonical non-negative integer weights proportional to a state.
+    """
+    den = 1
+    for x in state:
+        den = den * x.denominator // gcd(den, x.denominator)
+    weights = [x.numerator * (den // x.denominator) for x in state]
+
+    if any(w < 0 for w in weights):
+        raise ValueError("entropy requires non-negative state components")
+    common = 0
+    for w in weights:
+        common = gcd(common, w)
+    if common == 0:
+        raise ValueError("entropy requires a non-zero state")
+    return tuple(w // common for w in weights)
+
+
+def _log2_fixed_int(w: int) -> int:
+    e = w.bit_length() - 1
+    m = w >> (e - FRACTION_BITS) if e >= FRACTION_BITS else w << (FRACTION_BITS - e)
+    frac = 0
+    for _ in range(FRACTION_BITS):
+        m = (m * m) >> FRACTION_BITS
+        frac <<= 1
+        if m >= _TWO:
+            frac |= 1
+            m >>= 1
+    return (e << FRACTION_BITS) + frac
+
+
+def _floor_log2(w: np.ndarray) -> np.ndarray:
+    # floor(log2(w)) for positive int64 values (0 for w <= 1).
+    e = np.zeros_like(w)
+    for s in (32, 16, 8, 4, 2, 1):
+        e = np.where((w >> (e + s)) > 0, e + s, e)
+    return e
+
+
+def _bit_length(w: np.ndarray) -> np.ndarray:
+    return np.where(w > 0, _floor_log2(w) + 1, 0)
+
+
+def log2_fixed(values: np.ndarray) -> np.ndarray:
+    """
+    Fixed-point log2 of positive int64 values (FRACTION_BITS fraction bits).
+    """
+    w = np.asarray(values, dtype=np.int64)
+
+    e = _floor_log2(w)
+
+    m = np.where(
+        e >= FRACTION_BITS,
+        w >> np.maximum(e - FRACTION_BITS, 0),
+        w << np.maximum(FRACTION_BITS - e, 0),
+    )
+    frac = np.zeros_like(w)
+    for _ in range(FRACTION_BITS):
+        m = (m * m) >> FRACTION_BITS
+        carry = m >= _TWO
+        frac = (frac << 1) | carry
+        m = np.where(carry, m >> 1, m)
+
+    return (e << FRACTION_BITS) + frac
+
+
+def entropy_fixed(weights: np.ndarray) -> np.ndarray:
+    """
+    Fixed-point entropy of each row of a 2-D int64 weight array.
+
+    Rows may be zero-padded; each row total must be positive and below
+    2**26 so that no intermediate overflows.
+    """
+    w = np.asarray(weights, dtype=np.int64)
+    totals = w.sum(axis=1)
+    if (w < 0).any() or (totals <= 0).any() or (totals >= _VECTOR_LIMIT).any():
+        raise ValueError("weights out of range for vectorized entropy")
+
+    # log2 is evaluated once per distinct weight: state weights repeat heavily.
+    distinct, inverse = np.unique(np.maximum(w, 1), return_inverse=True)
+    logs = log2_fixed(distinct)[inverse].reshape(w.shape)
+    terms = (w * logs).sum(axis=1)
+    return log2_fixed(totals) - terms // totals
+
+
+def _entropy_fixed_int(weights: Sequence[int]) -> int:
+    total = sum(weights)
+    terms = sum(w * _log2_fixed_int(w) for w in weights if w)
+    return _log2_fixed_int(total) - terms // total
+
+
+def _entropy_or_none(state: Sequence[Fraction]) -> Optional[int]:
+    try:
+        return _entropy_fixed_int(state_weights(state))
+    except ValueError:
+        return None
+
+
+def _packed(states: List[Tuple]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Zero-padded numerator and one-padded denominator arrays.
+    Raises OverflowError if a component does not fit int64.
+    """
+    lengths = np.array([len(s) for s in states], dtype=np.int64)
+    width = int(lengths.max()) if len(states) else 0
+    present = np.arange(width) < lengths[:, None]
+
+    num = np.zeros((len(states), width), dtype=np.int64)
+    den = np.ones((len(states), width), dtype=np.int64)
+    num[present] = [x.numerator for s in states for x in s]
+    den[present] = [x.denominator for s in states for x in s]
+    return num, den
+
+
+def entropies_fixed(states: Iterable[Sequence[Fraction]]) -> Tuple[Optional[int], ...]:
+    """
+    Fixed-point entropy of each state, in input order; None for states
+    without an entropy (negative components, or none positive).
+    """
+    states = [tuple(s) for s in states]
+    result: List[Optional[int]] = [None] * len(states)
+    if not states:
+        return ()
+
+    try:
+        num, den = _packed(states)
+    except OverflowError:
+        return tuple(_entropy_or_none(s) for s in states)
+
+    negative = (num < 0).any(axis=1)
+    width = num.shape[1]
+    # weights are below 2**bound; keep their row sum below 2**62
+    bound = _bit_length(den).sum(axis=1) + _bit_length(num).max(axis=1, initial=0)
+    fast = ~negative & (bound <= 62 - width.bit_length())
+
+    rows = np.flatnonzero(fast)
+    if len(rows):
+        n, d = num[rows], den[rows]
+        lcm = np.lcm.reduce(d, axis=1)
+        w = n * (lcm[:, None] // d)
+        g = np.gcd.reduce(w, axis=1)
+        valid = g > 0
+        w = w // np.maximum(g, 1)[:, None]
+        totals = w.sum(axis=1)
+
+        kernel = valid & (totals < _VECTOR_LIMIT)
+        if kernel.any():
+            for i, h in zip(rows[kernel].tolist(), entropy_fixed(w[kernel]).tolist()):
+                result[i] = h
+        for k in np.flatnonzero(valid & ~kernel).tolist():
+            result[int(rows[k])] = _entropy_fixed_int(w[k].tolist())
+
+    for i in np.flatnonzero(~fast & ~negative).tolist():
+        result[i] = _entropy_or_none(states[i])
+
+    return tuple(result)
+
+
+def _shifts_fixed(transitions: Sequence) -> List[Optional[int]]:
+    before = entropies_fixed(t.parent_state for t in transitions)
+    after = entropies_fixed(t.child_state for t in transitions)
+    return [
+        None if a is None or b is None else a - b
+        for b, a in zip(before, after)
+    ]
+
+
+def entropy_shifts(transitions: Sequence) -> Tuple[Fraction, ...]:
+    """
+    Entropy change (child - parent) in bits for each transition.
+
+    Each value is exact in fixed point and within ENTROPY_ERROR_BOUND of
+    the true real-valued difference; None if either state has no entropy.
+    """
+    return tuple(
+        None if d is None else Fraction(d, _ONE)
+        for d in _shifts_fixed(tuple(transitions))
+    )
+
+
+def classify_irreversible(
+    transitions: Sequence,
+    threshold: Fraction = Fraction(1, 100),
+) -> Tuple[bool, ...]:
+    """
+    True for each transition whose entropy shift exceeds `threshold`.
+
+    Shifts within ENTROPY_ERROR_BOUND of the threshold are classified by
+    their fixed-point value, deterministically. Transitions involving a
+    state without an entropy are not irreversible.
+    """
+    threshold = Fraction(threshold)
+    limit = threshold.numerator * _ONE
+    den = threshold.denominator
+    return tuple(
+        d is not None and d * den > limit
+        for d in _shifts_fixed(tuple(transitions))
+    )
+
+
+__all__ = [
+    "ENTROPY_ERROR_BOUND",
+    "FRACTION_BITS",
+    "LOG2_ERROR_BOUND",
+    "classify_irreversible",
+    "entropies_fixed",
+    "entropy_fixed",
+    "entropy_shifts",
+    "log2_fixed",
+    "state_weights",
+]
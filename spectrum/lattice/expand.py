@@ -1,19 +1,101 @@
 """
 Deterministic Lattice Expansion Operator
-Phase 2.1 — Skeleton Only
+
+Guarantees:
+- No randomness
+- No time
+- No environment
+- Canonical ordering
+- Streaming: successors and explored states are generated lazily
 """
 
-from typing import Iterable
+from collections import deque
+from fractions import Fraction
+from typing import Iterable, Iterator, Optional, Sequence, Set, Tuple, Union
 from .state import LatticeState
 
-def expand(state: LatticeState) -> Iterable[LatticeState]:
+STEPS: Tuple[Fraction, ...] = (Fraction(1),)
+
+StateLike = Union[LatticeState, Sequence[Fraction]]
+
+
+def _value(state: StateLike) -> Tuple[Fraction, ...]:
+    if isinstance(state, LatticeState):
+        return tuple(state.value)
+    return tuple(Fraction(x) for x in state)
+
+
+def _canonical_steps(steps: Iterable) -> Tuple[Fraction, ...]:
+    return tuple(sorted({Fraction(s) for s in steps}))
+
+
+def _successors(value: Tuple[Fraction, ...], steps: Tuple[Fraction, ...]) -> Iterator[LatticeState]:
+    for axis, x in enumerate(value):
+        head = value[:axis]
+        tail = value[axis + 1:]
+        for step in steps:
+            if step:
+                yield LatticeState(head + (x + step,) + tail)
+
+
+def expand(
+    state: StateLike,
+    steps: Iterable = STEPS,
+) -> Iterator[LatticeState]:
     """
-    Deterministic placeholder expansion.
+    Successors of a state: one component moved by one step.
 
-    Guarantees:
-    - No randomness
-    - No time
-    - No environment
-    - Canonical ordering
+    Successors are yielded in (axis, step) order with steps ascending
+    and de-duplicated; zero steps are ignored. Accepts a LatticeState or
+    a plain rational vector.
     """
-    return ()
+    return _successors(_value(state), _canonical_steps(steps))
+
+
+def explore(
+    start: StateLike,
+    steps: Iterable = STEPS,
+    *,
+    max_states: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    visited: Optional[Set[Tuple[Fraction, ...]]] = None,
+) -> Iterator[LatticeState]:
+    """
+    Breadth-first exploration from `start`, yielding each state once.
+
+    Order is canonical: by depth, then by discovery through expand().
+    Stops after `max_states` states or beyond `max_depth` steps.
+
+    `visited` is an optional set of state values to treat as already
+    explored: they are neither yielded nor expanded through, and every
+    state yielded is added to it.
+    """
+    steps = _canonical_steps(steps)
+    seen = visited if visited is not None else set()
+    root = _value(start)
+
+    if max_states is not None and max_states <= 0:
+        return
+    if root in seen:
+        return
+    seen.add(root)
+
+    emitted = 1
+    yield LatticeState(root)
+    if max_states is not None and emitted >= max_states:
+        return
+
+    frontier = deque([(root, 0)])
+    while frontier:
+        value, depth = frontier.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for successor in _successors(value, steps):
+            if successor.value in seen:
+                continue
+            if max_states is not None and emitted >= max_states:
+                return
+            seen.add(successor.value)
+            emitted += 1
+            yield successor
+            frontier.append((successor.value, depth + 1))
@@ -0,0 +1,132 @@
+"""
+Hash-consing of rational components and state vectors.
+
+Equal values share one object, so equal interned states are identical
+(`a is b`) and their storage is paid once across the lattice.
+
+Rules:
+- Interned values compare and hash exactly like the originals
+- Only Fraction components are interned; other values pass through
+- Tables are owned by the caller: interning lasts as long as the table
+- Persistent vectors are interned by (interned prefix, last component),
+  so appending to an interned vector stays O(1) and keeps sharing
+"""
+
+from fractions import Fraction
+from typing import Dict, Hashable, Iterable, NamedTuple, Tuple
+import weakref
+from spectrum.lattice.pvector import PersistentVector
+
+
+class InternedFraction(Fraction):
+    """
+    Fraction that can be weakly referenced. Behaves exactly like Fraction;
+    arithmetic results are plain Fractions.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+class InternStats(NamedTuple):
+    hits: int
+    misses: int
+    fractions: int
+    states: int
+
+
+class InternTable:
+    """
+    Intern table for rationals and state vectors.
+
+    Fractions are keyed by (numerator, denominator) and held weakly.
+    States are held for the lifetime of the table and keyed by their
+    components: interned fractions by identity (a stored state keeps
+    them alive, so identities cannot be reused while the entry exists),
+    other values by (type, value) so that e.g. 1 and 1.0 stay distinct.
+    """
+
+    def __init__(self) -> None:
+        self._fractions = weakref.WeakValueDictionary()
+        self._states: Dict[Tuple[Hashable, ...], Tuple] = {}
+        self._empty = PersistentVector()
+        self._vectors: Dict[Tuple[int, Hashable], PersistentVector] = {}
+        self._vector_ids = {id(self._empty)}
+        self._hits = 0
+        self._misses = 0
+
+    def fraction(self, value: Fraction) -> InternedFraction:
+        key = (value.numerator, value.denominator)
+        interned = self._fractions.get(key)
+        if interned is None:
+            interned = InternedFraction(key[0], key[1])
+            self._fractions[key] = interned
+        return interned
+
+    def _component(self, value):
+        return self.fraction(value) if isinstance(value, Fraction) else value
+
+    @staticmethod
+    def _key(component) -> Hashable:
+        return id(component) if isinstance(component, Fraction) else (type(component), component)
+
+    def state(self, values: Iterable) -> Tuple:
+        components = tuple(self._component(x) for x in values)
+        key = tuple(self._key(x) for x in components)
+        interned = self._states.get(key)
+        if interned is not None:
+            self._hits += 1
+            return interned
+
+        self._misses += 1
+        self._states[key] = components
+        return components
+
+    def append(self, vector: PersistentVector, value) -> PersistentVector:
+        """
+        Interned `vector + (value,)`; `vector` must be interned here.
+        """
+        if id(vector) not in self._vector_ids:
+            raise ValueError("vector is not interned in this table")
+        component = self._component(value)
+        key = (id(vector), self._key(component))
+        interned = self._vectors.get(key)
+        if interned is not None:
+            self._hits += 1
+            return interned
+
+        self._misses += 1
+        interned = vector.append(component)
+        self._vectors[key] = interned
+        self._vector_ids.add(id(interned))
+        return interned
+
+    def vector(self, values: Iterable) -> PersistentVector:
+        """
+        Interned PersistentVector equal to `values`.
+        """
+        if id(values) in self._vector_ids:
+            return values
+        vector = self._empty
+        for x in values:
+            vector = self.append(vector, x)
+        return vector
+
+    def clear(self) -> None:
+        self._states.clear()
+        self._vectors.clear()
+        self._vector_ids = {id(self._empty)}
+
+    def stats(self) -> InternStats:
+        return InternStats(
+            hits=self._hits,
+            misses=self._misses,
+            fractions=len(self._fractions),
+            states=len(self._states) + len(self._vectors),
+        )
+
+
+__all__ = [
+    "InternStats",
+    "InternTable",
+    "InternedFraction",
+]
@@ -0,0 +1,226 @@
+"""
+Persistent state vectors with structural sharing.
+
+Rules:
+- Immutable: append returns a new vector, the original is unchanged
+- Equal to, and hashes like, the tuple of its elements
+- Prefixes are shared, so a chain of appends costs O(1) per step
+
+Layout is a 32-way trie of full leaves plus a tail of up to 32 trailing
+elements. Appends copy only the tail (and, every 32 appends, one path of
+the trie); indexing walks O(log32 n) levels.
+"""
+
+from itertools import chain
+from typing import Any, Iterable, Iterator
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+
+def _new_path(level: int, node: tuple) -> tuple:
+    while level:
+        node = (node,)
+        level -= _BITS
+    return node
+
+
+def _push_tail(count: int, level: int, parent: tuple, tail: tuple) -> tuple:
+    sub = ((count - 1) >> level) & _MASK
+    if level == _BITS:
+        insert = tail
+    elif sub < len(parent):
+        insert = _push_tail(count, level - _BITS, parent[sub], tail)
+    else:
+        insert = _new_path(level - _BITS, tail)
+    return parent[:sub] + (insert,)
+
+
+def _iter_leaves(node: tuple, level: int) -> Iterator[tuple]:
+    if level == 0:
+        yield node
+        return
+    for child in node:
+        yield from _iter_leaves(child, level - _BITS)
+
+
+class PersistentVector:
+    """
+    Immutable sequence usable wherever a state tuple is expected.
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_hash")
+
+    def __init__(self, values: Iterable[Any] = ()) -> None:
+        values = tuple(values)
+        count = len(values)
+        tail_start = (count - 1) & ~_MASK if count else 0
+
+        nodes = [values[i:i + _WIDTH] for i in range(0, tail_start, _WIDTH)]
+        shift = _BITS
+        while len(nodes) > _WIDTH:
+            nodes = [tuple(nodes[i:i + _WIDTH]) for i in range(0, len(nodes), _WIDTH)]
+            shift += _BITS
+
+        self._count = count
+        self._shift = shift
+        self._root = tuple(nodes)
+        self._tail = values[tail_start:]
+        self._hash = None
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: tuple, tail: tuple) -> "PersistentVector":
+        v = object.__new__(cls)
+        v._count = count
+        v._shift = shift
+        v._root = root
+        v._tail = tail
+        v._hash = None
+        return v
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _as_tuple(self) -> tuple:
+        if not self._root:
+            return self._tail
+        return tuple(chain.from_iterable(_iter_leaves(self._root, self._shift))) + self._tail
+
+    # ---- persistent updates ----
+
+    def append(self, value: Any) -> "PersistentVector":
+        count, shift, root, tail = self._count, self._shift, self._root, self._tail
+        if len(tail) < _WIDTH:
+            return self._make(count + 1, shift, root, tail + (value,))
+
+        if (count >> _BITS) > (1 << shift):
+            root = (root, _new_path(shift, tail))
+            shift += _BITS
+        else:
+            root = _push_tail(count, shift, root, tail)
+        return self._make(count + 1, shift, root, (value,))
+
+    def extend(self, values: Iterable[Any]) -> "PersistentVector":
+        v = self
+        for x in values:
+            v = v.append(x)
+        return v
+
+    def __add__(self, other):
+        if isinstance(other, (tuple, PersistentVector)):
+            return self.extend(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, tuple):
+            return PersistentVector(other).extend(self)
+        return NotImplemented
+
+    def __mul__(self, n):
+        if isinstance(n, int):
+            return PersistentVector(self._as_tuple() * n)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    # ---- sequence protocol ----
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._as_tuple()[index]
+
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("PersistentVector index out of range")
+
+        offset = self._tail_offset()
+        if index >= offset:
+            return self._tail[index - offset]
+
+        node = self._root
+        level = self._shift
+        while level:
+            node = node[(index >> level) & _MASK]
+            level -= _BITS
+        return node[index & _MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        for leaf in _iter_leaves(self._root, self._shift):
+            yield from leaf
+        yield from self._tail
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._as_tuple())
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._as_tuple()
+
+    def index(self, value: Any, *args) -> int:
+        return self._as_tuple().index(value, *args)
+
+    def count(self, value: Any) -> int:
+        return self._as_tuple().count(value)
+
+    # ---- tuple compatibility ----
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, (tuple, PersistentVector)):
+            return NotImplemented
+        if len(other) != self._count:
+            return False
+        if isinstance(other, PersistentVector):
+            if other._root is self._root:
+                return self._tail == other._tail
+            other = other._as_tuple()
+        return self._as_tuple() == other
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, (tuple, PersistentVector)):
+            return NotImplemented
+        return self._as_tuple() < tuple(other)
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, (tuple, PersistentVector)):
+            return NotImplemented
+        return self._as_tuple() <= tuple(other)
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, (tuple, PersistentVector)):
+            return NotImplemented
+        return self._as_tuple() > tuple(other)
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, (tuple, PersistentVector)):
+            return NotImplemented
+        return self._as_tuple() >= tuple(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._as_tuple())
+        return self._hash
+
+    def __reduce__(self):
+        return (PersistentVector, (self._as_tuple(),))
+
+    def __repr__(self) -> str:
+        return f"PersistentVector({self._as_tuple()!r})"
+
+
+def as_persistent(values: Iterable[Any]) -> PersistentVector:
+    """
+    `values` as a PersistentVector, without copying one that already is.
+    """
+    if isinstance(values, PersistentVector):
+        return values
+    return PersistentVector(values)
+
+
+__all__ = ["PersistentVector", "as_persistent"]
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import Any
+from fractions import Fraction
+from typing import Tuple
 
 @dataclass(frozen=True)
 class LatticeState:
-    """Lightweight stub for lattice states."""
-    value: Any
+    """
+    Point of the lattice state space: an exact rational vector.
+    """
+    value: Tuple[Fraction, ...]
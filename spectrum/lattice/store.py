@@ -0,0 +1,198 @@
+"""
+Columnar lattice node storage.
+
+Rules:
+- Append-only
+- Exact values (rationals are interned, never rounded)
+- Nodes are materialized lazily, on demand
+"""
+
+from array import array
+from bisect import bisect_left
+from fractions import Fraction
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from spectrum.lattice.node import LatticeNode
+
+
+class LatticeStore:
+    """
+    Array-backed store for large lattices.
+
+    Layout (one row per node, rows kept in insertion order):
+      - ids:            int64 node ids
+      - parent_offsets: int64 CSR offsets into parent_index (rows + 1)
+      - parent_index:   int64 parent ids, sorted within each row
+      - state_offsets:  int64 CSR offsets into state_index (rows + 1)
+      - state_index:    int64 indices into the interned value table
+      - numerators / denominators: interned value table (exact Python ints)
+
+    Only the canonical fields (id, state_vector, parents) are stored.
+    Materialized nodes carry transition_rule=None and causal_input_hash=b"",
+    exactly as replayed nodes do.
+    """
+
+    __slots__ = (
+        "ids",
+        "parent_offsets",
+        "parent_index",
+        "state_offsets",
+        "state_index",
+        "numerators",
+        "denominators",
+        "_values",
+        "_value_ids",
+        "_sorted",
+        "_rows",
+    )
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.parent_offsets = array("q", (0,))
+        self.parent_index = array("q")
+        self.state_offsets = array("q", (0,))
+        self.state_index = array("q")
+        self.numerators: List[int] = []
+        self.denominators: List[int] = []
+        self._values: List[Fraction] = []
+        self._value_ids: Dict[Tuple[int, int], int] = {}
+        self._sorted = True
+        self._rows: Optional[Dict[int, int]] = None
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[LatticeNode]) -> "LatticeStore":
+        store = cls()
+        for n in nodes:
+            store.append(n.id, n.state_vector, n.parents)
+        return store
+
+    # ---- construction ----
+
+    def intern_value(self, value) -> int:
+        """
+        Index of an exact rational in the value table, adding it if new.
+        """
+        key = (value.numerator, value.denominator)
+        idx = self._value_ids.get(key)
+        if idx is None:
+            idx = len(self._values)
+            self._value_ids[key] = idx
+            self.numerators.append(key[0])
+            self.denominators.append(key[1])
+            self._values.append(Fraction(key[0], key[1]))
+        return idx
+
+    def append_indexed(
+        self,
+        node_id: int,
+        value_indices: Iterable[int],
+        parents: Iterable[int],
+    ) -> int:
+        """
+        Append a row whose state is given as value-table indices.
+        Returns the new row number.
+        """
+        row = len(self.ids)
+        if row and node_id < self.ids[-1]:
+            self._sorted = False
+        self.ids.append(node_id)
+        self.parent_index.extend(sorted(parents))
+        self.parent_offsets.append(len(self.parent_index))
+        self.state_index.extend(value_indices)
+        self.state_offsets.append(len(self.state_index))
+        if self._rows is not None:
+            self._rows.setdefault(node_id, row)
+        return row
+
+    def append(
+        self,
+        node_id: int,
+        state_vector: Iterable,
+        parents: Iterable[int],
+    ) -> int:
+        """
+        Append a node given by its canonical fields.
+        Returns the new row number.
+        """
+        return self.append_indexed(
+            node_id,
+            [self.intern_value(x) for x in state_vector],
+            parents,
+        )
+
+    # ---- columnar access ----
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def parents(self, row: int) -> Tuple[int, ...]:
+        return tuple(
+            self.parent_index[self.parent_offsets[row]:self.parent_offsets[row + 1]]
+        )
+
+    def state_indices(self, row: int) -> Sequence[int]:
+        return self.state_index[self.state_offsets[row]:self.state_offsets[row + 1]]
+
+    def state(self, row: int) -> Tuple[Fraction, ...]:
+        values = self._values
+        return tuple(values[i] for i in self.state_indices(row))
+
+    def iter_edges(self) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        """
+        Yield (node_id, parent_ids) per row, in row order.
+        """
+        ids = self.ids
+        offsets = self.parent_offsets
+        index = self.parent_index
+        for row in range(len(ids)):
+            yield ids[row], tuple(index[offsets[row]:offsets[row + 1]])
+
+    def canonical_rows(self) -> Sequence[int]:
+        """
+        Row numbers ordered by node id (stable for duplicate ids).
+        """
+        if self._sorted:
+            return range(len(self.ids))
+        return sorted(range(len(self.ids)), key=self.ids.__getitem__)
+
+    def row_of(self, node_id: int) -> int:
+        """
+        Row of the first node with the given id.
+        """
+        if self._sorted:
+            row = bisect_left(self.ids, node_id)
+            if row < len(self.ids) and self.ids[row] == node_id:
+                return row
+            raise KeyError(node_id)
+
+        if self._rows is None:
+            rows: Dict[int, int] = {}
+            for row, nid in enumerate(self.ids):
+                rows.setdefault(nid, row)
+            self._rows = rows
+        return self._rows[node_id]
+
+    # ---- materialization ----
+
+    def node(self, row: int) -> LatticeNode:
+        return LatticeNode(
+            id=self.ids[row],
+            state_vector=self.state(row),
+            parents=set(self.parents(row)),
+        )
+
+    def __getitem__(self, row: int) -> LatticeNode:
+        if row < 0:
+            row += len(self.ids)
+        if not 0 <= row < len(self.ids):
+            raise IndexError("row out of range")
+        return self.node(row)
+
+    def get(self, node_id: int) -> LatticeNode:
+        return self.node(self.row_of(node_id))
+
+    def __iter__(self) -> Iterator[LatticeNode]:
+        for row in range(len(self.ids)):
+            yield self.node(row)
+
+
+__all__ = ["LatticeStore"]
@@ -3,10 +3,14 @@ Deterministic execution logging.
 """
 from spectrum.logging.core import (
     ExecutionRecord,
+    batch_digest,
     record_execution,
 )
+from spectrum.logging.store import ExecutionLog
 
 __all__ = [
+    "ExecutionLog",
     "ExecutionRecord",
+    "batch_digest",
     "record_execution",
 ]
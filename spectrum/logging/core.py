@@ -7,10 +7,17 @@ Rules:
 - Content-addressed
 """
 
-from dataclasses import dataclass, asdict
-from typing import Mapping, Any, Dict
+from dataclasses import dataclass
+from typing import Mapping, Any, Dict, Sequence
 import hashlib
 import json
+from spectrum.merkle import merkle_root
+
+_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=True,
+)
 
 
 def _canonical_json(obj: Any) -> str:
@@ -36,6 +43,29 @@ def _hash_record(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+def _hash_execution(
+    engine: str,
+    input_state: Dict[str, Any],
+    output: Any,
+    invariants: Dict[str, bool],
+) -> str:
+    """
+    Equivalent of _hash_record for an execution payload.
+
+    The payload references the caller's dicts instead of copying them and
+    is encoded by the shared _ENCODER instead of a per-call json.dumps
+    encoder. Byte-identical to _hash_record: ensure_ascii output is pure
+    ASCII.
+    """
+    payload = {
+        "engine": engine,
+        "input_state": input_state,
+        "output": output,
+        "invariants": invariants,
+    }
+    return hashlib.sha256(_ENCODER.encode(payload).encode("ascii")).hexdigest()
+
+
 def record_execution(
     *,
     engine: str,
@@ -48,19 +78,25 @@ def record_execution(
     if not isinstance(invariants, Mapping):
         raise TypeError("invariants must be a mapping")
 
-    payload = {
-        "engine": engine,
-        "input_state": dict(input_state),
-        "output": output,
-        "invariants": dict(invariants),
-    }
-
-    digest = _hash_record(payload)
+    state = dict(input_state)
+    checks = dict(invariants)
 
     return ExecutionRecord(
         engine=engine,
-        input_state=dict(input_state),
+        input_state=state,
         output=output,
-        invariants=dict(invariants),
-        digest=digest,
+        invariants=checks,
+        digest=_hash_execution(engine, state, output, checks),
     )
+
+
+def batch_digest(digests: Sequence[str]) -> str:
+    """
+    Merkle root over record digests, in order.
+
+    RFC 6962 tree shape and domain separation: leaves are
+    SHA-256(0x00 || digest), interior nodes SHA-256(0x01 || left || right),
+    and an unpaired node is carried up unchanged. The empty batch hashes
+    to SHA-256 of the empty string.
+    """
+    return merkle_root(bytes.fromhex(d) for d in digests).hex()
@@ -0,0 +1,207 @@
+"""
+Append-only, content-addressed store for execution records.
+
+Rules:
+- Records are never rewritten or removed
+- Records are addressed by their SHA-256 digest
+- Identical records are stored once
+"""
+
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+import json
+import os
+import struct
+from spectrum.logging.core import ExecutionRecord, _canonical_json, _hash_execution
+
+# digest (32 bytes) | segment number | byte offset | byte length
+_INDEX_ENTRY = struct.Struct("<32sIQI")
+_INDEX_NAME = "index.bin"
+
+
+def _segment_name(number: int) -> str:
+    return f"segment-{number:06d}.log"
+
+
+class ExecutionLog:
+    """
+    Directory-backed execution log.
+
+    Layout:
+      - segment-NNNNNN.log: one canonical JSON record per line
+      - index.bin:          fixed-width digest -> (segment, offset, length)
+
+    The index is loaded into memory on open, so lookups are O(1). Writes
+    are flushed and fsync'ed every `sync_every` appends and on close.
+    Each record is flushed to its segment before its index entry is
+    written. On open, the index is cut at a torn trailing entry or at
+    the first entry pointing past the end of its segment (from a crash
+    before the segment reached disk); those records can be re-appended.
+
+    Records read back hold JSON-decoded values (tuples become lists); the
+    digest is re-verified on every read.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        segment_size: int = 64 * 2**20,
+        sync_every: int = 1024,
+    ) -> None:
+        if segment_size <= 0 or sync_every <= 0:
+            raise ValueError("segment_size and sync_every must be positive")
+
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._segment_size = segment_size
+        self._sync_every = sync_every
+        self._unsynced = 0
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._readers: Dict[int, BinaryIO] = {}
+
+        index_path = os.path.join(path, _INDEX_NAME)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                data = f.read()
+            usable = len(data) - len(data) % _INDEX_ENTRY.size
+            sizes: Dict[int, int] = {}
+            for i, (digest, segment, offset, length) in enumerate(
+                _INDEX_ENTRY.iter_unpack(data[:usable])
+            ):
+                if segment not in sizes:
+                    seg_path = self._segment_path(segment)
+                    sizes[segment] = os.path.getsize(seg_path) if os.path.exists(seg_path) else 0
+                if offset + length > sizes[segment]:
+                    usable = i * _INDEX_ENTRY.size
+                    break
+                self._index.setdefault(digest, (segment, offset, length))
+            self._index_file = open(index_path, "r+b")
+            self._index_file.truncate(usable)
+            self._index_file.seek(usable)
+        else:
+            self._index_file = open(index_path, "wb")
+
+        self._segment = 0
+        while os.path.exists(self._segment_path(self._segment + 1)):
+            self._segment += 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self._path, _segment_name(number))
+
+    # ---- writing ----
+
+    def append(self, record: ExecutionRecord) -> bool:
+        """
+        Store a record. Returns False if an identical record is present.
+        """
+        key = bytes.fromhex(record.digest)
+        if key in self._index:
+            return False
+
+        line = _canonical_json({
+            "digest": record.digest,
+            "engine": record.engine,
+            "input_state": record.input_state,
+            "invariants": record.invariants,
+            "output": record.output,
+        }).encode("ascii") + b"\n"
+
+        offset = self._writer.tell()
+        if offset and offset + len(line) > self._segment_size:
+            self._roll()
+            offset = 0
+
+        self._writer.write(line)
+        self._writer.flush()
+        self._index_file.write(
+            _INDEX_ENTRY.pack(key, self._segment, offset, len(line))
+        )
+        self._index[key] = (self._segment, offset, len(line))
+
+        self._unsynced += 1
+        if self._unsynced >= self._sync_every:
+            self.sync()
+        return True
+
+    def _roll(self) -> None:
+        self.sync()
+        self._writer.close()
+        self._segment += 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+    def sync(self) -> None:
+        """
+        Flush and fsync pending segment and index writes.
+        """
+        for f in (self._writer, self._index_file):
+            f.flush()
+            os.fsync(f.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        if self._writer.closed:
+            return
+        self.sync()
+        self._writer.close()
+        self._index_file.close()
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def __enter__(self) -> "ExecutionLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---- reading ----
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, digest: str) -> bool:
+        return bytes.fromhex(digest) in self._index
+
+    def _read(self, segment: int, offset: int, length: int) -> ExecutionRecord:
+        if segment == self._segment:
+            self._writer.flush()
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = open(self._segment_path(segment), "rb")
+            self._readers[segment] = reader
+        reader.seek(offset)
+        data = json.loads(reader.read(length))
+
+        record = ExecutionRecord(
+            engine=data["engine"],
+            input_state=data["input_state"],
+            output=data["output"],
+            invariants=data["invariants"],
+            digest=data["digest"],
+        )
+        digest = _hash_execution(
+            record.engine, record.input_state, record.output, record.invariants
+        )
+        if digest != record.digest:
+            raise ValueError(f"corrupt execution record {record.digest}")
+        return record
+
+    def get(self, digest: str) -> Optional[ExecutionRecord]:
+        """
+        Record with the given digest, or None.
+        """
+        location = self._index.get(bytes.fromhex(digest))
+        if location is None:
+            return None
+        return self._read(*location)
+
+    def __iter__(self) -> Iterator[ExecutionRecord]:
+        """
+        All records in append order.
+        """
+        for location in tuple(self._index.values()):
+            yield self._read(*location)
+
+
+__all__ = ["ExecutionLog"]
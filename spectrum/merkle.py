@@ -0,0 +1,40 @@
+"""
+Merkle tree hashing over raw leaf data.
+
+Rules:
+- RFC 6962 tree shape and domain separation: leaves SHA-256(0x00 || data),
+  interior nodes SHA-256(0x01 || left || right)
+- The empty tree hashes to SHA-256 of the empty string
+- Depends only on hashlib, so any layer may use it
+"""
+
+from typing import Iterable
+import hashlib
+
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+
+def leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def merkle_root(leaves: Iterable[bytes]) -> bytes:
+    """
+    RFC 6962 root over raw leaf data, in order.
+    """
+    level = [leaf_hash(d) for d in leaves]
+    if not level:
+        return EMPTY_ROOT
+    while len(level) > 1:
+        paired = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+__all__ = ["EMPTY_ROOT", "leaf_hash", "merkle_root", "node_hash"]
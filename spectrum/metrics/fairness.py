@@ -1,7 +1,13 @@
 from fractions import Fraction
 from collections import defaultdict
 
-def demographic_parity(outputs, groups):
+def demographic_parity(outputs, groups, rate=Fraction):
+    """
+    Positive rate per group, built as rate(positives, total).
+
+    `rate` is Fraction by default; spectrum.rational.fixed.Rational gives
+    equal (and equal-hashing) values without per-rate normalization.
+    """
     totals = defaultdict(int)
     positives = defaultdict(int)
 
@@ -9,4 +15,4 @@ def demographic_parity(outputs, groups):
         totals[g] += 1
         positives[g] += int(o)
 
-    return {g: Fraction(positives[g], totals[g]) for g in totals}
+    return {g: rate(positives[g], totals[g]) for g in totals}
@@ -4,3 +4,19 @@ def rational_divide(n, d):
     if d == 0:
         raise ZeroDivisionError
     return Fraction(n, d)
+
+
+try:
+    Fraction(1, 1, _normalize=False)
+except TypeError:  # Python 3.12+ dropped the flag
+    def reduced_fraction(numerator, denominator):
+        """
+        Fraction from an already-reduced pair.
+        """
+        return Fraction(numerator, denominator)
+else:
+    def reduced_fraction(numerator, denominator):
+        """
+        Fraction from an already-reduced pair, skipping gcd normalization.
+        """
+        return Fraction(numerator, denominator, _normalize=False)
@@ -0,0 +1,306 @@
+"""
+Lightweight exact rational for hot arithmetic.
+
+Rules:
+- Exact: every operation is exact; floats are never produced implicitly
+- Interoperable: equal values compare and hash equal to Fraction
+- Lazy: results are reduced only when observed (numerator, denominator,
+  hashing, conversion) or when the denominator grows past a bound
+
+Values with the same denominator add and subtract as scaled integers,
+with no gcd and no denominator product; adding an integer preserves
+reducedness. Comparisons cross-multiply and never normalize.
+"""
+
+from fractions import Fraction
+from math import gcd
+import numbers
+from spectrum.rational.core import rational_divide
+
+# Unreduced denominators are normalized once they exceed this many bits.
+_NORMALIZE_BITS = 64
+
+
+class Rational:
+    """
+    Exact rational number; accepts int, Fraction or Rational operands.
+    """
+
+    __slots__ = ("_num", "_den", "_reduced")
+
+    def __init__(self, numerator=0, denominator=1) -> None:
+        if isinstance(numerator, (Rational, Fraction)) and denominator == 1:
+            self._num = numerator.numerator
+            self._den = numerator.denominator
+            self._reduced = True
+            return
+        if not isinstance(numerator, int) or not isinstance(denominator, int):
+            raise TypeError("Rational requires integer numerator and denominator")
+        if denominator == 0:
+            raise ZeroDivisionError("Rational(%s, 0)" % numerator)
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        self._num = numerator
+        self._den = denominator
+        self._reduced = denominator == 1
+
+    @classmethod
+    def _make(cls, num: int, den: int, reduced: bool) -> "Rational":
+        r = object.__new__(cls)
+        r._num = num
+        r._den = den
+        r._reduced = reduced
+        if not reduced and den.bit_length() > _NORMALIZE_BITS:
+            r._normalize()
+        return r
+
+    def _normalize(self) -> None:
+        if not self._reduced:
+            g = gcd(self._num, self._den)
+            if g != 1:
+                self._num //= g
+                self._den //= g
+            self._reduced = True
+
+    # ---- observation ----
+
+    @property
+    def numerator(self) -> int:
+        self._normalize()
+        return self._num
+
+    @property
+    def denominator(self) -> int:
+        self._normalize()
+        return self._den
+
+    def to_fraction(self) -> Fraction:
+        self._normalize()
+        return rational_divide(self._num, self._den)
+
+    def __repr__(self) -> str:
+        return f"Rational({self.numerator}, {self.denominator})"
+
+    def __str__(self) -> str:
+        if self.denominator == 1:
+            return str(self._num)
+        return f"{self._num}/{self._den}"
+
+    def __float__(self) -> float:
+        return self._num / self._den
+
+    def __bool__(self) -> bool:
+        return self._num != 0
+
+    def __trunc__(self) -> int:
+        if self._num < 0:
+            return -(-self._num // self._den)
+        return self._num // self._den
+
+    __int__ = __trunc__
+
+    def __floor__(self) -> int:
+        return self._num // self._den
+
+    def __ceil__(self) -> int:
+        return -(-self._num // self._den)
+
+    def __round__(self, ndigits=None):
+        result = round(self.to_fraction(), ndigits)
+        return result if ndigits is None else Rational(result)
+
+    def __hash__(self) -> int:
+        return hash(self.to_fraction())
+
+    # ---- arithmetic ----
+
+    @staticmethod
+    def _coerce(other):
+        """
+        (num, den, reduced) of an exact operand, or None.
+        """
+        if isinstance(other, Rational):
+            return other._num, other._den, other._reduced
+        if isinstance(other, int):
+            return other, 1, True
+        if isinstance(other, Fraction):
+            return other.numerator, other.denominator, True
+        return None
+
+    def _add(self, num: int, den: int, reduced: bool) -> "Rational":
+        if den == 1:
+            return self._make(self._num + num * self._den, self._den, self._reduced)
+        if den == self._den:
+            return self._make(self._num + num, den, False)
+        if self._den == 1:
+            return self._make(self._num * den + num, den, reduced)
+        return self._make(self._num * den + num * self._den, self._den * den, False)
+
+    def __add__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return self._add(*o)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return self._add(-o[0], o[1], o[2])
+
+    def __rsub__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return (-self)._add(*o)
+
+    def __neg__(self) -> "Rational":
+        return self._make(-self._num, self._den, self._reduced)
+
+    def __pos__(self) -> "Rational":
+        return self
+
+    def __abs__(self) -> "Rational":
+        return self._make(abs(self._num), self._den, self._reduced)
+
+    def __mul__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        num, den, _ = o
+        return self._make(self._num * num, self._den * den, den == 1 and self._den == 1)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        num, den, _ = o
+        if num == 0:
+            raise ZeroDivisionError("Rational division by zero")
+        if num < 0:
+            num, den = -num, -den
+        return self._make(self._num * den, self._den * num, False)
+
+    def __rtruediv__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return Rational._make(o[0], o[1], o[2]) / self
+
+    def __floordiv__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        num, den, _ = o
+        if num == 0:
+            raise ZeroDivisionError("Rational division by zero")
+        return (self._num * den) // (self._den * num)
+
+    def __rfloordiv__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return Rational._make(o[0], o[1], o[2]) // self
+
+    def __mod__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return self - (self // other) * other
+
+    def __rmod__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return Rational._make(o[0], o[1], o[2]) % self
+
+    def __divmod__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        q = self // other
+        return q, self - q * other
+
+    def __rdivmod__(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return NotImplemented
+        return divmod(Rational._make(o[0], o[1], o[2]), self)
+
+    def __pow__(self, other):
+        """
+        Exact for integer exponents; otherwise follows Fraction.
+        """
+        if isinstance(other, int):
+            if other >= 0:
+                return self._make(self._num ** other, self._den ** other, self._reduced)
+            if self._num == 0:
+                raise ZeroDivisionError("Rational(0) raised to a negative power")
+            num, den = self._den ** -other, self._num ** -other
+            if den < 0:
+                num, den = -num, -den
+            return self._make(num, den, self._reduced)
+        if isinstance(other, (Rational, Fraction)):
+            result = self.to_fraction() ** Fraction(other.numerator, other.denominator)
+            return Rational(result) if isinstance(result, Fraction) else result
+        return NotImplemented
+
+    def __rpow__(self, other):
+        if isinstance(other, (int, Fraction)):
+            result = other ** self.to_fraction()
+            return Rational(result) if isinstance(result, (int, Fraction)) else result
+        return NotImplemented
+
+    # ---- comparison ----
+
+    def _cross(self, other):
+        o = self._coerce(other)
+        if o is None:
+            return None
+        num, den, _ = o
+        return self._num * den, num * self._den
+
+    def __eq__(self, other):
+        c = self._cross(other)
+        if c is None:
+            if isinstance(other, float):
+                return self.to_fraction() == other
+            return NotImplemented
+        return c[0] == c[1]
+
+    def __lt__(self, other):
+        c = self._cross(other)
+        if c is None:
+            return NotImplemented
+        return c[0] < c[1]
+
+    def __le__(self, other):
+        c = self._cross(other)
+        if c is None:
+            return NotImplemented
+        return c[0] <= c[1]
+
+    def __gt__(self, other):
+        c = self._cross(other)
+        if c is None:
+            return NotImplemented
+        return c[0] > c[1]
+
+    def __ge__(self, other):
+        c = self._cross(other)
+        if c is None:
+            return NotImplemented
+        return c[0] >= c[1]
+
+    def __reduce__(self):
+        return (Rational, (self.numerator, self.denominator))
+
+
+numbers.Rational.register(Rational)
+
+
+__all__ = ["Rational"]
@@ -0,0 +1,262 @@
+"""
+Exact rational vectors backed by NumPy integer arrays.
+
+Rules:
+- Bit-exact: values are numerators over one common denominator
+- Canonical: the denominator is the least common one (gcd of all
+  numerators and the denominator is 1), so equal vectors have equal
+  representations
+- Overflow-safe: results whose magnitude bound exceeds int64 are computed
+  on Python ints (object arrays) and narrowed back when they fit again
+
+Shapes are 1-D (one state) or 2-D (one row per state of a layer).
+"""
+
+from fractions import Fraction
+from math import gcd, lcm
+from typing import Sequence, Tuple, Union
+import numpy as np
+from spectrum.rational.core import reduced_fraction
+from spectrum.rational.fixed import Rational
+
+_INT64_MAX = (1 << 63) - 1
+
+Scalar = Union[int, Fraction, Rational]
+
+
+def _max_abs(nums: np.ndarray) -> int:
+    if nums.size == 0:
+        return 0
+    return max(int(nums.max()), -int(nums.min()))
+
+
+def _scaled(nums: np.ndarray, factor: int, bound: int) -> np.ndarray:
+    """
+    nums * factor, as int64 if `bound` and `factor` fit, else as Python ints.
+    """
+    if bound <= _INT64_MAX and abs(factor) <= _INT64_MAX and nums.dtype != object:
+        return nums * np.int64(factor)
+    return np.asarray(nums.astype(object) * factor, dtype=object)
+
+
+def _common_gcd(nums: np.ndarray, den: int) -> int:
+    if nums.size == 0:
+        return den
+    if nums.dtype != object:
+        return gcd(int(np.gcd.reduce(nums.ravel())), den)
+    g = den
+    for x in nums.ravel().tolist():
+        g = gcd(g, x)
+        if g == 1:
+            break
+    return g
+
+
+class RationalVector:
+    """
+    Immutable exact rational array: numerators / denominator.
+    """
+
+    __slots__ = ("numerators", "denominator")
+
+    def __init__(self, numerators, denominator: int = 1) -> None:
+        if denominator == 0:
+            raise ZeroDivisionError("RationalVector with zero denominator")
+        nums = np.asarray(numerators)
+        if nums.dtype != object and nums.dtype.kind not in "iu":
+            raise TypeError("RationalVector requires integer numerators")
+        if denominator < 0:
+            nums, denominator = -nums.astype(object), -denominator
+        self._set(nums, int(denominator))
+
+    def _set(self, nums: np.ndarray, den: int) -> None:
+        g = _common_gcd(nums, den)
+        if g > _INT64_MAX and nums.dtype != object:
+            nums = nums.astype(object)
+        if g > 1:
+            nums = nums // g
+            den //= g
+
+        if nums.dtype == object:
+            if _max_abs(nums) <= _INT64_MAX:
+                nums = nums.astype(np.int64)
+        elif nums.dtype != np.int64:
+            nums = nums.astype(np.int64)
+        nums.flags.writeable = False
+
+        object.__setattr__(self, "numerators", nums)
+        object.__setattr__(self, "denominator", den)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RationalVector is immutable")
+
+    @classmethod
+    def _make(cls, nums: np.ndarray, den: int) -> "RationalVector":
+        v = object.__new__(cls)
+        v._set(nums, den)
+        return v
+
+    # ---- conversion ----
+
+    @classmethod
+    def from_values(cls, values: Sequence[Scalar]) -> "RationalVector":
+        """
+        1-D vector from one state.
+        """
+        values = tuple(values)
+        if not values:
+            return cls._make(np.zeros(0, dtype=np.int64), 1)
+        return cls.from_states([values]).row(0)
+
+    @classmethod
+    def from_states(cls, states: Sequence[Sequence[Scalar]]) -> "RationalVector":
+        """
+        2-D vector from equal-length states (one row each).
+        """
+        states = list(states)
+        width = len(states[0]) if states else 0
+        if any(len(s) != width for s in states):
+            raise ValueError("states must have equal dimension")
+
+        flat = [x for s in states for x in s]
+        dens = [x.denominator for x in flat]
+        den = lcm(*set(dens)) if dens else 1
+        values = [x.numerator * (den // d) for x, d in zip(flat, dens)]
+        if values and max(max(values), -min(values)) > _INT64_MAX:
+            nums = np.array(values, dtype=object)
+        else:
+            nums = np.array(values, dtype=np.int64)
+        return cls._make(nums.reshape(len(states), width), den)
+
+    def to_tuples(self):
+        """
+        Tuple of Fractions (1-D) or tuple of such tuples (2-D), as the
+        canonical serializer expects.
+        """
+        nums = self.numerators
+        den = self.denominator
+        if nums.dtype != object and den <= _INT64_MAX:
+            # One Fraction per distinct value; equal elements share it.
+            distinct, inverse = np.unique(nums.ravel(), return_inverse=True)
+            divisors = np.gcd(distinct, np.int64(den))
+            table = [
+                reduced_fraction(n // g, den // g)
+                for n, g in zip(distinct.tolist(), divisors.tolist())
+            ]
+            flat = [table[i] for i in inverse.tolist()]
+        else:
+            flat = []
+            for n in nums.ravel().tolist():
+                g = gcd(n, den)
+                flat.append(reduced_fraction(n // g, den // g))
+        if nums.ndim == 1:
+            return tuple(flat)
+        width = nums.shape[1]
+        if width == 0:
+            return ((),) * nums.shape[0]
+        return tuple(tuple(flat[i:i + width]) for i in range(0, len(flat), width))
+
+    def row(self, i: int) -> "RationalVector":
+        return self._make(self.numerators[i], self.denominator)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.numerators.shape
+
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    # ---- arithmetic ----
+
+    def _operands(self, other):
+        """
+        (numerators, denominator) of a vector or scalar operand, or None.
+        """
+        if isinstance(other, RationalVector):
+            return other.numerators, other.denominator
+        if isinstance(other, (int, Fraction, Rational)):
+            return np.array(other.numerator, dtype=object), other.denominator
+        return None
+
+    def _aligned(self, other):
+        """
+        Both operands' numerators over their least common denominator.
+        """
+        nums, den = other
+        common = lcm(self.denominator, den)
+        fa, fb = common // self.denominator, common // den
+        bound = _max_abs(self.numerators) * fa + _max_abs(nums) * fb
+        if nums.dtype == object and bound <= _INT64_MAX:
+            nums = nums.astype(np.int64)
+        a = _scaled(self.numerators, fa, bound)
+        b = _scaled(nums, fb, bound)
+        if a.dtype != b.dtype:
+            a, b = a.astype(object), b.astype(object)
+        return a, b, common
+
+    def __add__(self, other):
+        o = self._operands(other)
+        if o is None:
+            return NotImplemented
+        a, b, den = self._aligned(o)
+        return self._make(a + b, den)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._operands(other)
+        if o is None:
+            return NotImplemented
+        a, b, den = self._aligned(o)
+        return self._make(a - b, den)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __neg__(self) -> "RationalVector":
+        return self._make(-self.numerators, self.denominator)
+
+    def scale(self, factor: Scalar) -> "RationalVector":
+        """
+        Multiply every element by a rational scalar.
+        """
+        num, den = factor.numerator, factor.denominator
+        bound = _max_abs(self.numerators) * abs(num)
+        return self._make(_scaled(self.numerators, num, bound), self.denominator * den)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, Fraction, Rational)):
+            return self.scale(other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    # ---- comparison ----
+
+    def compare(self, other) -> np.ndarray:
+        """
+        Elementwise sign of (self - other): -1, 0 or 1, as int8.
+        """
+        o = self._operands(other)
+        if o is None:
+            raise TypeError("cannot compare RationalVector with %r" % type(other))
+        a, b, _ = self._aligned(o)
+        diff = np.sign(a - b)
+        return np.asarray(diff, dtype=np.int8)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RationalVector):
+            return NotImplemented
+        return (
+            self.denominator == other.denominator
+            and self.shape == other.shape
+            and bool(np.array_equal(self.numerators, other.numerators))
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"RationalVector({self.numerators.tolist()!r}, {self.denominator})"
+
+
+__all__ = ["RationalVector"]
@@ -2,29 +2,94 @@
 Deterministic replay engine for canonical lattice states.
 """
 
-from typing import Iterable, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
 from fractions import Fraction
+from math import gcd
+import heapq
+import os
+import re
 from spectrum.lattice.node import LatticeNode
+from spectrum.rational.core import reduced_fraction
+from spectrum.serialization.canonical import remember_canonical_line
 
+# Text int() accepts but serialize_node never writes: whitespace,
+# underscores, signs other than a leading "-", leading zeros, "-0".
+_NON_CANONICAL = re.compile(r"[\s_+]|[=,/-]0\d|-0/")
 
-def parse_fraction(s: str) -> Fraction:
+
+def parse_fraction(s: str, trusted: bool = False) -> Fraction:
+    """
+    Parse "num/den".
+
+    trusted=True requires canonical input (reduced, positive denominator)
+    and does not normalize; the default verifies and normalizes. Skipping
+    normalization only saves work on Python <= 3.11 (see
+    rational.core.reduced_fraction); on later versions both modes cost
+    the same.
+    """
     num, den = s.split("/")
+    if trusted:
+        return reduced_fraction(int(num), int(den))
     return Fraction(int(num), int(den))
 
 
-def parse_node(line: str) -> LatticeNode:
+def parse_state(field: str, trusted: bool = False) -> Tuple[Fraction, ...]:
+    """
+    Parse a whole state field ("n/d,n/d,...") in one call.
+    """
+    if not field:
+        return ()
+    if trusted:
+        state = _canonical_state(field)
+        if state is not None:
+            return state
+    return tuple(parse_fraction(x) for x in field.split(",") if x)
+
+
+def _canonical_state(field: str) -> Optional[Tuple[Fraction, ...]]:
+    """
+    State of a field whose fractions are all reduced with positive
+    denominators, or None if any is not.
+    """
+    ints = list(map(int, field.replace("/", ",").split(",")))
+    nums, dens = ints[0::2], ints[1::2]
+    if min(dens) <= 0 or any(g != 1 for g in map(gcd, nums, dens)):
+        return None
+    return tuple(map(reduced_fraction, nums, dens))
+
+
+def parse_node(line: str, trusted: bool = False) -> LatticeNode:
     """
     Parse canonical node serialization.
+
+    trusted=True reads the fields positionally and builds fractions
+    without normalization, and keeps the line as the node's memoized
+    canonical line. The line must be as written by serialize_node; a
+    cheap check (sorted parents, reduced fractions, no padded or signed
+    numbers) sends lines that fail it through the verified path instead.
     """
+    if trusted and not _NON_CANONICAL.search(line):
+        id_field, state_field, parents_field = line.split("|")
+        state_field, parents_field = state_field[6:], parents_field[8:]
+        parents = list(map(int, parents_field.split(","))) if parents_field else []
+        state = _canonical_state(state_field) if state_field else ()
+        if state is not None and all(a < b for a, b in zip(parents, parents[1:])):
+            node = LatticeNode(
+                id=int(id_field[3:]),
+                state_vector=state,
+                parents=set(parents),
+                transition_rule=None,
+                causal_input_hash=b"",
+            )
+            remember_canonical_line(node, line)
+            return node
+
     parts = dict(p.split("=", 1) for p in line.split("|"))
 
     node_id = int(parts["id"])
 
-    state = tuple(
-        parse_fraction(x)
-        for x in parts["state"].split(",")
-        if x
-    )
+    state = parse_state(parts["state"])
 
     parents = (
         set(int(x) for x in parts["parents"].split(","))
@@ -41,9 +106,82 @@ def parse_node(line: str) -> LatticeNode:
     )
 
 
-def replay_nodes(serialized: Iterable[str]) -> Tuple[LatticeNode, ...]:
+def replay_nodes(
+    serialized: Iterable[str],
+    trusted: bool = False,
+) -> Tuple[LatticeNode, ...]:
     """
     Deterministically reconstruct nodes from canonical serialization.
     """
-    nodes = tuple(parse_node(line) for line in serialized)
+    nodes = tuple(parse_node(line, trusted) for line in serialized)
+    return tuple(sorted(nodes, key=lambda n: n.id))
+
+
+def _shard_bounds(path: str, shards: int) -> List[int]:
+    """
+    Byte offsets splitting a file into `shards` ranges on line starts.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for k in range(1, shards):
+            target = size * k // shards
+            f.seek(max(target - 1, 0))
+            if target:
+                f.readline()
+            bounds.append(max(f.tell(), bounds[-1]))
+    bounds.append(size)
+    return bounds
+
+
+def _replay_shard(
+    path: str,
+    start: int,
+    end: int,
+    trusted: bool = False,
+) -> Tuple[LatticeNode, ...]:
+    """
+    Replay the lines starting in [start, end), sorted by id.
+    """
+    nodes = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            raw = f.readline()
+            pos += len(raw)
+            nodes.append(parse_node(raw.rstrip(b"\n").decode("utf-8"), trusted))
     return tuple(sorted(nodes, key=lambda n: n.id))
+
+
+def replay_nodes_parallel(
+    path: str,
+    workers: int = 1,
+    *,
+    trusted: bool = False,
+) -> Tuple[LatticeNode, ...]:
+    """
+    Replay a canonical serialization file using a process pool.
+
+    The file is split on line boundaries into one shard per worker; shards
+    are parsed and sorted independently and then k-way merged by id. The
+    merge is stable in file order, so the result is identical to
+    replay_nodes over the file's lines for every worker count.
+    trusted is passed through to parse_node.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    bounds = _shard_bounds(path, workers)
+    starts = bounds[:-1]
+    ends = bounds[1:]
+
+    if workers == 1:
+        shards = [_replay_shard(path, starts[0], ends[0], trusted)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = list(pool.map(
+                _replay_shard, [path] * workers, starts, ends, [trusted] * workers
+            ))
+
+    return tuple(heapq.merge(*shards, key=lambda n: n.id))
@@ -0,0 +1,285 @@
+"""
+Binary canonical serialization for lattice structures.
+
+Guarantees:
+- Lossless round trip with the text format (identical hash_nodes digest)
+- Versioned, length-prefixed records in id order
+- Random access by id without decoding the whole file
+
+Layout (version 1, integers little-endian):
+
+    header   b"SPLB" | u8 version
+    records  varint(payload length) | payload          (one per node)
+    index    i64 id | u64 record offset                (one per node)
+    footer   u64 node count | u64 index offset | b"SPLB"
+
+    payload  zigzag(id)
+             varint(dim)      { zigzag(numerator) varint(denominator) } * dim
+             varint(parents)  zigzag(first parent) { varint(gap) } * (parents - 1)
+
+Varints are unsigned LEB128 and hold arbitrarily large integers; zig-zag
+maps signed integers onto them. Parents form a CSR row: a count followed
+by the sorted ids, delta-encoded. The index requires ids to fit in int64.
+"""
+
+from bisect import bisect_left
+from fractions import Fraction
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+import mmap
+import struct
+from spectrum.lattice.node import LatticeNode
+from spectrum.replay.replay import parse_node
+from spectrum.serialization.canonical import serialize_node
+
+MAGIC = b"SPLB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sB")
+_INDEX_ENTRY = struct.Struct("<qQ")
+_FOOTER = struct.Struct("<QQ4s")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _read_varint(buf, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_node(node: LatticeNode) -> bytes:
+    """
+    Binary payload of a single node (without the length prefix).
+    """
+    out = bytearray()
+    _write_varint(out, _zigzag(node.id))
+
+    _write_varint(out, len(node.state_vector))
+    for x in node.state_vector:
+        _write_varint(out, _zigzag(x.numerator))
+        _write_varint(out, x.denominator)
+
+    parents = sorted(node.parents)
+    _write_varint(out, len(parents))
+    if parents:
+        _write_varint(out, _zigzag(parents[0]))
+        for prev, p in zip(parents, parents[1:]):
+            _write_varint(out, p - prev)
+
+    return bytes(out)
+
+
+def decode_node(buf, pos: int = 0) -> LatticeNode:
+    """
+    Decode a payload starting at `pos`.
+    """
+    raw, pos = _read_varint(buf, pos)
+    node_id = _unzigzag(raw)
+
+    dim, pos = _read_varint(buf, pos)
+    state = []
+    for _ in range(dim):
+        raw, pos = _read_varint(buf, pos)
+        den, pos = _read_varint(buf, pos)
+        state.append(Fraction(_unzigzag(raw), den))
+
+    count, pos = _read_varint(buf, pos)
+    parents = set()
+    if count:
+        raw, pos = _read_varint(buf, pos)
+        p = _unzigzag(raw)
+        parents.add(p)
+        for _ in range(count - 1):
+            gap, pos = _read_varint(buf, pos)
+            p += gap
+            parents.add(p)
+
+    return LatticeNode(
+        id=node_id,
+        state_vector=tuple(state),
+        parents=parents,
+        transition_rule=None,
+        causal_input_hash=b"",
+    )
+
+
+def write_binary(
+    nodes: Iterable[LatticeNode],
+    fp: BinaryIO,
+    *,
+    presorted: bool = False,
+) -> int:
+    """
+    Write nodes in canonical id order. Returns the number of nodes.
+
+    presorted=True streams an id-ordered iterator without sorting and
+    raises ValueError if the order is violated.
+    """
+    if not presorted:
+        nodes = sorted(nodes, key=lambda n: n.id)
+
+    fp.write(_HEADER.pack(MAGIC, VERSION))
+    offset = _HEADER.size
+    index: List[Tuple[int, int]] = []
+
+    for n in nodes:
+        if index and n.id < index[-1][0]:
+            raise ValueError(f"nodes not in id order at id {n.id}")
+        payload = encode_node(n)
+        prefix = bytearray()
+        _write_varint(prefix, len(payload))
+        fp.write(prefix)
+        fp.write(payload)
+        index.append((n.id, offset))
+        offset += len(prefix) + len(payload)
+
+    for entry in index:
+        fp.write(_INDEX_ENTRY.pack(*entry))
+    fp.write(_FOOTER.pack(len(index), offset, MAGIC))
+
+    return len(index)
+
+
+class BinaryLatticeReader:
+    """
+    Memory-mapped reader for the binary format.
+
+    Nodes are decoded lazily: iteration walks the record section in id
+    order and get() binary-searches the index, touching only the pages
+    it needs.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("empty file is not a binary lattice")
+
+        size = len(self._map)
+        if size < _HEADER.size + _FOOTER.size:
+            self.close()
+            raise ValueError("truncated binary lattice")
+
+        magic, version = _HEADER.unpack_from(self._map, 0)
+        count, index_offset, tail = _FOOTER.unpack_from(self._map, size - _FOOTER.size)
+        if magic != MAGIC or tail != MAGIC:
+            self.close()
+            raise ValueError("not a binary lattice")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"unsupported binary lattice version {version}")
+        if index_offset + count * _INDEX_ENTRY.size != size - _FOOTER.size:
+            self.close()
+            raise ValueError("corrupt binary lattice index")
+
+        self._count = count
+        self._index_offset = index_offset
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "BinaryLatticeReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int) -> Tuple[int, int]:
+        return _INDEX_ENTRY.unpack_from(
+            self._map, self._index_offset + i * _INDEX_ENTRY.size
+        )
+
+    def _id_at(self, i: int) -> int:
+        return self._entry(i)[0]
+
+    def _decode_at(self, offset: int) -> LatticeNode:
+        _, start = _read_varint(self._map, offset)
+        return decode_node(self._map, start)
+
+    def ids(self) -> Iterator[int]:
+        for i in range(self._count):
+            yield self._id_at(i)
+
+    def get(self, node_id: int) -> LatticeNode:
+        """
+        First node with the given id (KeyError if absent).
+        """
+        i = bisect_left(_IndexView(self), node_id)
+        if i == self._count or self._id_at(i) != node_id:
+            raise KeyError(node_id)
+        return self._decode_at(self._entry(i)[1])
+
+    def __iter__(self) -> Iterator[LatticeNode]:
+        buf = self._map
+        pos = _HEADER.size
+        end = self._index_offset
+        while pos < end:
+            length, start = _read_varint(buf, pos)
+            yield decode_node(buf, start)
+            pos = start + length
+
+
+class _IndexView:
+    """
+    Sequence of ids over the on-disk index, for bisect.
+    """
+
+    def __init__(self, reader: BinaryLatticeReader) -> None:
+        self._reader = reader
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __getitem__(self, i: int) -> int:
+        return self._reader._id_at(i)
+
+
+def text_to_binary(lines: Iterable[str], fp: BinaryIO) -> int:
+    """
+    Convert canonical text lines to the binary format.
+    """
+    return write_binary((parse_node(line) for line in lines), fp)
+
+
+def binary_to_text(reader: BinaryLatticeReader) -> Iterator[str]:
+    """
+    Canonical text lines of a binary lattice, in id order.
+    """
+    for n in reader:
+        yield serialize_node(n)
+
+
+__all__ = [
+    "BinaryLatticeReader",
+    "binary_to_text",
+    "decode_node",
+    "encode_node",
+    "text_to_binary",
+    "write_binary",
+]
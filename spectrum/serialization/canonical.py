@@ -7,24 +7,112 @@ Guarantees:
 - Hash-safe
 """
 
-from typing import Iterable, Tuple
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional, Tuple
+from collections import OrderedDict
 from fractions import Fraction
+from functools import lru_cache
+from itertools import islice
 import hashlib
+import heapq
+import tempfile
+import weakref
 from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.store import LatticeStore
+
+DEFAULT_RUN_SIZE = 1_000_000
+FRACTION_CACHE_SIZE = 4096
+LINE_CACHE_SIZE = 65536
+
+# Bounded memo of canonical lines, keyed by id(node) in LRU order. An
+# entry holds a weak reference to its node (so a recycled id never hits),
+# plus the parents and state vector it was computed from (so mutated
+# parents or a swapped state never hit).
+_LINES: "OrderedDict[int, Tuple[weakref.ref, frozenset, Tuple, str]]" = OrderedDict()
+_LINE_STATS = [0, 0]  # hits, misses
+
+
+class SerializationCacheInfo(NamedTuple):
+    line_hits: int
+    line_misses: int
+    line_size: int
+    fraction_hits: int
+    fraction_misses: int
+    fraction_size: int
+
+
+@lru_cache(maxsize=FRACTION_CACHE_SIZE)
+def _format_fraction(numerator: int, denominator: int) -> str:
+    return f"{numerator}/{denominator}"
 
 
 def _serialize_fraction(f: Fraction) -> str:
-    return f"{f.numerator}/{f.denominator}"
+    return _format_fraction(f.numerator, f.denominator)
 
 
 def serialize_node(node: LatticeNode) -> str:
     """
     Canonical string form of a node.
+
+    Lines are memoized in a bounded side cache (LINE_CACHE_SIZE entries),
+    not on the node, so they never outlive the cache or travel with it.
     """
+    key = id(node)
+    entry = _LINES.get(key)
+    if (
+        entry is not None
+        and entry[0]() is node
+        and entry[2] is node.state_vector
+        and entry[1] == node.parents
+    ):
+        _LINE_STATS[0] += 1
+        _LINES.move_to_end(key)
+        return entry[3]
+
+    _LINE_STATS[1] += 1
     parents = ",".join(str(p) for p in sorted(node.parents))
     state = ",".join(_serialize_fraction(x) for x in node.state_vector)
 
-    return f"id={node.id}|state={state}|parents={parents}"
+    line = f"id={node.id}|state={state}|parents={parents}"
+    remember_canonical_line(node, line)
+    return line
+
+
+def remember_canonical_line(node: LatticeNode, line: str) -> None:
+    """
+    Memoize `line` as the canonical line of `node`.
+
+    The caller guarantees that line == serialize_node(node), e.g. because
+    node was just parsed from it.
+    """
+    key = id(node)
+    _LINES.pop(key, None)
+    while _LINES and len(_LINES) >= LINE_CACHE_SIZE:
+        _LINES.popitem(last=False)
+    _LINES[key] = (weakref.ref(node), frozenset(node.parents), node.state_vector, line)
+
+
+def serialization_cache_info() -> SerializationCacheInfo:
+    """
+    Hit/miss counters and sizes of the line memo and the fraction text LRU.
+    """
+    fractions = _format_fraction.cache_info()
+    return SerializationCacheInfo(
+        line_hits=_LINE_STATS[0],
+        line_misses=_LINE_STATS[1],
+        line_size=len(_LINES),
+        fraction_hits=fractions.hits,
+        fraction_misses=fractions.misses,
+        fraction_size=fractions.currsize,
+    )
+
+
+def clear_serialization_cache() -> None:
+    """
+    Reset the counters and empty the line and fraction caches.
+    """
+    _LINES.clear()
+    _format_fraction.cache_clear()
+    _LINE_STATS[0] = _LINE_STATS[1] = 0
 
 
 def serialize_nodes(nodes: Iterable[LatticeNode]) -> Tuple[str, ...]:
@@ -42,7 +130,148 @@ def hash_nodes(nodes: Iterable[LatticeNode]) -> str:
     Stable SHA-256 hash of canonical serialization.
     """
     h = hashlib.sha256()
-    for line in serialize_nodes(nodes):
+    for n in sorted(nodes, key=lambda n: n.id):
+        h.update(serialize_node(n).encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _line_id(line: bytes) -> int:
+    return int(line[3:line.index(b"|")])
+
+
+def _iter_sorted_runs(
+    nodes: Iterable[LatticeNode],
+    run_size: int,
+    tmpdir: Optional[str],
+) -> Iterator[str]:
+    """
+    External merge sort by node id.
+
+    Input is cut into runs of `run_size` nodes; each run is sorted and
+    spilled to a temporary file as canonical lines, then the runs are
+    merged. Ties keep input order, exactly like sorted().
+    """
+    it = iter(nodes)
+    runs = []
+    try:
+        while True:
+            chunk = sorted(islice(it, run_size), key=lambda n: n.id)
+            if not chunk:
+                break
+            if not runs and len(chunk) < run_size:
+                # Whole input fits in one run: no spill needed.
+                for n in chunk:
+                    yield serialize_node(n)
+                return
+            run = tempfile.TemporaryFile(dir=tmpdir)
+            for n in chunk:
+                run.write(serialize_node(n).encode("utf-8"))
+                run.write(b"\n")
+            run.seek(0)
+            runs.append(run)
+
+        for line in heapq.merge(*runs, key=_line_id):
+            yield line[:-1].decode("utf-8")
+    finally:
+        for run in runs:
+            run.close()
+
+
+def iter_serialize_nodes(
+    nodes: Iterable[LatticeNode],
+    *,
+    presorted: bool = False,
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmpdir: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Streaming form of serialize_nodes: yields the same lines, in order.
+
+    presorted=True consumes an id-ordered iterator directly and raises
+    ValueError if the order is violated. Otherwise nodes are sorted with
+    an on-disk merge sort, holding at most `run_size` nodes in memory.
+    """
+    if not presorted:
+        yield from _iter_sorted_runs(nodes, run_size, tmpdir)
+        return
+
+    previous = None
+    for n in nodes:
+        if previous is not None and n.id < previous:
+            raise ValueError(f"nodes not in id order at id {n.id}")
+        previous = n.id
+        yield serialize_node(n)
+
+
+def write_nodes(
+    nodes: Iterable[LatticeNode],
+    fp: BinaryIO,
+    *,
+    presorted: bool = False,
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmpdir: Optional[str] = None,
+) -> str:
+    """
+    Write the canonical serialization to a binary stream (file, or a
+    socket via socket.makefile("wb")), one newline-terminated line per node.
+
+    Returns the SHA-256 of the bytes written, which equals hash_nodes.
+    """
+    h = hashlib.sha256()
+    for line in iter_serialize_nodes(
+        nodes, presorted=presorted, run_size=run_size, tmpdir=tmpdir
+    ):
+        data = line.encode("utf-8") + b"\n"
+        h.update(data)
+        fp.write(data)
+    return h.hexdigest()
+
+
+def hash_nodes_stream(
+    nodes: Iterable[LatticeNode],
+    *,
+    presorted: bool = False,
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmpdir: Optional[str] = None,
+) -> str:
+    """
+    Streaming form of hash_nodes. Same digest, bounded memory.
+    """
+    h = hashlib.sha256()
+    for line in iter_serialize_nodes(
+        nodes, presorted=presorted, run_size=run_size, tmpdir=tmpdir
+    ):
+        h.update(line.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _iter_store_lines(store: LatticeStore) -> Iterator[str]:
+    values = tuple(
+        f"{n}/{d}" for n, d in zip(store.numerators, store.denominators)
+    )
+    for row in store.canonical_rows():
+        parents = ",".join(str(p) for p in store.parents(row))
+        state = ",".join(values[i] for i in store.state_indices(row))
+        yield f"id={store.ids[row]}|state={state}|parents={parents}"
+
+
+def serialize_store(store: LatticeStore) -> Tuple[str, ...]:
+    """
+    Canonical serialization of a columnar store.
+    Identical to serialize_nodes over the materialized nodes.
+    """
+    return tuple(_iter_store_lines(store))
+
+
+def hash_store(store: LatticeStore) -> str:
+    """
+    Stable SHA-256 hash of a columnar store.
+    Identical to hash_nodes over the materialized nodes.
+    """
+    h = hashlib.sha256()
+    for line in _iter_store_lines(store):
         h.update(line.encode("utf-8"))
         h.update(b"\n")
     return h.hexdigest()
@@ -0,0 +1,187 @@
+"""
+Merkle digests for lattice structures.
+
+Guarantees:
+- Leaves are canonical node lines (serialize_node, UTF-8) in id order
+- RFC 6962 tree shape and domain separation: leaves SHA-256(0x00 || line),
+  interior nodes SHA-256(0x01 || left || right); the empty tree hashes
+  to SHA-256 of the empty string
+- O(log n) root update on append, O(log n)-sized inclusion proofs,
+  verifiable without the lattice (RFC 9162, section 2.1.3.2)
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+import hashlib
+from spectrum.lattice.node import LatticeNode
+from spectrum.merkle import EMPTY_ROOT, leaf_hash, merkle_root, node_hash
+from spectrum.serialization.canonical import serialize_node
+
+
+def _node_line(node: LatticeNode) -> bytes:
+    return serialize_node(node).encode("utf-8")
+
+
+class MerkleLattice:
+    """
+    Append-only Merkle tree over canonical node lines.
+
+    levels[k][i] holds the root of the complete subtree over leaves
+    [i * 2**k, (i + 1) * 2**k); appending a leaf extends at most one
+    entry per level. The root of any prefix of the lattice is folded
+    from the complete subtrees along its binary decomposition, so roots
+    and proofs for earlier sizes stay available.
+    """
+
+    def __init__(self) -> None:
+        self._levels: List[List[bytes]] = [[]]
+        self._ids: List[int] = []
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[LatticeNode]) -> "MerkleLattice":
+        tree = cls()
+        for n in sorted(nodes, key=lambda n: n.id):
+            tree.append(n)
+        return tree
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, node: LatticeNode) -> None:
+        """
+        Add the next node; ids must not decrease.
+        """
+        if self._ids and node.id < self._ids[-1]:
+            raise ValueError(f"nodes not in id order at id {node.id}")
+        self._ids.append(node.id)
+
+        h = leaf_hash(_node_line(node))
+        levels = self._levels
+        k = 0
+        while True:
+            levels[k].append(h)
+            if len(levels[k]) % 2:
+                break
+            h = node_hash(levels[k][-2], h)
+            k += 1
+            if k == len(levels):
+                levels.append([])
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        size = end - start
+        if size & (size - 1) == 0 and start % size == 0:
+            return self._levels[size.bit_length() - 1][start // size]
+        split = 1 << ((size - 1).bit_length() - 1)
+        return node_hash(self._subtree(start, start + split), self._subtree(start + split, end))
+
+    def _size(self, size) -> int:
+        if size is None:
+            return len(self._ids)
+        if not 0 <= size <= len(self._ids):
+            raise ValueError("size out of range")
+        return size
+
+    def root(self, size: int = None) -> str:
+        """
+        Hex root over the first `size` nodes (default: all).
+        """
+        size = self._size(size)
+        if size == 0:
+            return EMPTY_ROOT.hex()
+        return self._subtree(0, size).hex()
+
+    def index(self, node_id: int) -> int:
+        """
+        Leaf index of the first node with the given id (KeyError if absent).
+        """
+        i = bisect_left(self._ids, node_id)
+        if i == len(self._ids) or self._ids[i] != node_id:
+            raise KeyError(node_id)
+        return i
+
+    def inclusion_proof(self, index: int, size: int = None) -> Tuple[str, ...]:
+        """
+        Audit path for leaf `index` in the tree of the first `size` leaves.
+        """
+        size = self._size(size)
+        if not 0 <= index < size:
+            raise IndexError("leaf index out of range")
+
+        path: List[bytes] = []
+        start, end = 0, size
+        while end - start > 1:
+            split = start + (1 << ((end - start - 1).bit_length() - 1))
+            if index < split:
+                path.append(self._subtree(split, end))
+                end = split
+            else:
+                path.append(self._subtree(start, split))
+                start = split
+        return tuple(h.hex() for h in reversed(path))
+
+
+def verify_inclusion(
+    line: str,
+    index: int,
+    size: int,
+    proof: Sequence[str],
+    root: str,
+) -> bool:
+    """
+    Check that `line` is leaf `index` of the size-`size` tree with `root`.
+    """
+    if not 0 <= index < size:
+        return False
+
+    fn, sn = index, size - 1
+    r = leaf_hash(line.encode("utf-8"))
+    for p in proof:
+        p = bytes.fromhex(p)
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r.hex() == root
+
+
+@dataclass(frozen=True)
+class LatticeDigests:
+    """
+    flat: hash_nodes digest; merkle: MerkleLattice root.
+    """
+
+    flat: str
+    merkle: str
+
+
+def lattice_digests(nodes: Iterable[LatticeNode]) -> LatticeDigests:
+    """
+    Flat and Merkle digests in a single pass over the canonical lines.
+    """
+    flat = hashlib.sha256()
+    lines = []
+    for n in sorted(nodes, key=lambda n: n.id):
+        line = _node_line(n)
+        flat.update(line)
+        flat.update(b"\n")
+        lines.append(line)
+    return LatticeDigests(flat=flat.hexdigest(), merkle=merkle_root(lines).hex())
+
+
+__all__ = [
+    "LatticeDigests",
+    "MerkleLattice",
+    "lattice_digests",
+    "leaf_hash",
+    "merkle_root",
+    "node_hash",
+    "verify_inclusion",
+]
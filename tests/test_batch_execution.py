@@ -0,0 +1,76 @@
+import pytest
+from spectrum.api.execute import execute, execute_batch
+from spectrum.api.contracted_execute import execute_batch_with_contract
+from spectrum.api.engine_execute import execute_engine, execute_engine_batch
+from spectrum.contracts import Contract
+from spectrum.engines.examples import add_one_engine
+from spectrum.logging import batch_digest
+
+
+def triple(state):
+    return state["x"] * 3
+
+
+_CONTRACT = Contract(name="add-one", input_keys=("x",), output_type=int)
+
+
+def test_batch_matches_single_execution():
+    states = [{"x": i} for i in range(5)]
+    batch = execute_batch("triple", states, triple)
+
+    assert batch.records == tuple(execute("triple", s, triple) for s in states)
+    assert batch.digest == batch_digest([r.digest for r in batch.records])
+
+
+def test_batch_independent_of_workers():
+    states = [{"x": i} for i in range(9)]
+    serial = execute_batch("triple", states, triple)
+    pooled = execute_batch("triple", states, triple, workers=3)
+
+    assert pooled == serial
+
+
+def test_engine_batch_matches_single_execution():
+    states = [{"x": 2}, {"x": 7}]
+    batch = execute_engine_batch(
+        engine_name="add_one",
+        engine_version="1.0.0",
+        engine_fn=add_one_engine,
+        contract=_CONTRACT,
+        states=states,
+    )
+
+    singles = tuple(
+        execute_engine(
+            engine_name="add_one",
+            engine_version="1.0.0",
+            engine_fn=add_one_engine,
+            contract=_CONTRACT,
+            state=s,
+        )
+        for s in states
+    )
+    assert batch.records == singles
+
+
+def test_contract_checked_before_execution():
+    calls = []
+
+    def tracked(state):
+        calls.append(state)
+        return state["x"]
+
+    with pytest.raises(KeyError):
+        execute_batch_with_contract(
+            engine="tracked",
+            states=[{"x": 1}, {}],
+            contract=_CONTRACT,
+            fn=tracked,
+        )
+    assert calls == []
+
+
+def test_batch_digest_shape():
+    d = [r.digest for r in execute_batch("triple", [{"x": i} for i in range(3)], triple).records]
+    assert batch_digest(d) != batch_digest(d[:2])
+    assert batch_digest(d[:1]) != d[0]
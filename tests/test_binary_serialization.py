@@ -0,0 +1,69 @@
+from fractions import Fraction
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.replay.replay import replay_nodes
+from spectrum.serialization.canonical import serialize_nodes, hash_nodes
+from spectrum.serialization.binary import (
+    BinaryLatticeReader,
+    binary_to_text,
+    decode_node,
+    encode_node,
+    text_to_binary,
+    write_binary,
+)
+
+
+def _nodes():
+    return (
+        LatticeNode(id=7, state_vector=(Fraction(-3, 4), Fraction(2**70, 3)), parents={1, 300, 2}),
+        LatticeNode(id=1, state_vector=(Fraction(0),), parents=set()),
+        LatticeNode(id=-2, state_vector=(), parents={-5}),
+    )
+
+
+def _write(tmp_path, nodes):
+    path = tmp_path / "lattice.bin"
+    with open(path, "wb") as fp:
+        write_binary(nodes, fp)
+    return str(path)
+
+
+def test_node_round_trip():
+    for n in _nodes():
+        assert decode_node(encode_node(n)) == n
+
+
+def test_reader_iterates_in_id_order(tmp_path):
+    nodes = _nodes()
+    with BinaryLatticeReader(_write(tmp_path, nodes)) as reader:
+        assert len(reader) == 3
+        assert tuple(reader.ids()) == (-2, 1, 7)
+        assert tuple(reader) == tuple(sorted(nodes, key=lambda n: n.id))
+        assert hash_nodes(reader) == hash_nodes(nodes)
+
+
+def test_reader_random_access(tmp_path):
+    nodes = _nodes()
+    with BinaryLatticeReader(_write(tmp_path, nodes)) as reader:
+        assert reader.get(7) == nodes[0]
+        assert reader.get(-2) == nodes[2]
+        with pytest.raises(KeyError):
+            reader.get(3)
+
+
+def test_text_conversion_is_lossless(tmp_path):
+    lines = serialize_nodes(_nodes())
+    path = tmp_path / "converted.bin"
+    with open(path, "wb") as fp:
+        text_to_binary(lines, fp)
+
+    with BinaryLatticeReader(str(path)) as reader:
+        assert tuple(binary_to_text(reader)) == lines
+        assert tuple(reader) == replay_nodes(lines)
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bogus.bin"
+    path.write_bytes(b"id=1|state=|parents=\n" * 4)
+    with pytest.raises(ValueError):
+        BinaryLatticeReader(str(path))
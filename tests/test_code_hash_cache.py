@@ -0,0 +1,62 @@
+from spectrum.engines import (
+    clear_code_hash_cache,
+    code_hash_cache_info,
+    get_engine_spec,
+)
+from spectrum.engines.examples import add_one_engine
+from spectrum.engines.registry import _hash_callable, _hash_source
+
+
+def test_repeated_lookups_hit_cache():
+    clear_code_hash_cache()
+
+    for _ in range(3):
+        get_engine_spec("add_one", "1.0.0", add_one_engine)
+
+    info = code_hash_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_cached_hash_equals_source_hash():
+    clear_code_hash_cache()
+    assert _hash_callable(add_one_engine) == _hash_source(add_one_engine)
+    assert _hash_callable(add_one_engine) == _hash_source(add_one_engine)
+
+
+def test_code_replacement_invalidates():
+    def engine(state):
+        return state["x"]
+
+    def other(state):
+        return state["x"] + 1
+
+    clear_code_hash_cache()
+    before = _hash_callable(engine)
+    original = engine.__code__
+    engine.__code__ = other.__code__
+    try:
+        assert _hash_callable(engine) != before
+        assert code_hash_cache_info().misses == 2
+    finally:
+        engine.__code__ = original
+
+
+def test_recreated_functions_share_one_bounded_entry(monkeypatch):
+    from spectrum.engines import registry
+
+    def make():
+        def engine(state):
+            return state["x"]
+        return engine
+
+    clear_code_hash_cache()
+    digests = {_hash_callable(make()) for _ in range(5)}
+    assert len(digests) == 1
+    assert code_hash_cache_info() == (4, 1, 1)
+
+    monkeypatch.setattr(registry, "CODE_HASH_CACHE_SIZE", 2)
+    for fn in (add_one_engine, make(), _hash_source, _hash_callable):
+        _hash_callable(fn)
+    assert code_hash_cache_info().currsize == 2
@@ -0,0 +1,54 @@
+from itertools import product
+import pytest
+from spectrum.logging.core import _hash_execution, _hash_record, record_execution
+
+_SCALARS = (
+    0, -1, 2**80, True, False, None, "", "x", "é☃", "quote\"\\\n",
+    0.5, -0.0, 1e308, -1.5e-300, 5e-324, 1e16, 2.0**-1074 * 3,
+    float("inf"), float("-inf"), float("nan"),
+)
+
+
+def _values():
+    yield from _SCALARS
+    for a, b in product(_SCALARS, repeat=2):
+        yield [a, b]
+        yield (b, [a])
+    for key, value in product(("a", "B", "é"), _SCALARS):
+        yield {key: value, "z": [value, {"k": key}]}
+    for key, value in product((3, True, None, -0.0, 1e300), _SCALARS):
+        yield {key: [value]}
+
+
+def _reference(engine, state, output, invariants):
+    return _hash_record({
+        "engine": engine,
+        "input_state": dict(state),
+        "output": output,
+        "invariants": dict(invariants),
+    })
+
+
+def test_streaming_digest_matches_reference():
+    invariants = {"non_empty_state": True, "no_randomness": True, "a": False}
+    for i, value in enumerate(_values()):
+        state = {"x": value, "i": i}
+        assert _hash_execution("engé", state, value, invariants) == _reference(
+            "engé", state, value, invariants
+        )
+
+
+def test_record_digest_matches_reference():
+    for invariants in ({}, {"b": True, "a": False}, {"a": False, "b": True}):
+        record = record_execution(
+            engine="e",
+            input_state={"y": [1, 2], "x": None},
+            output={"out": (1, "two")},
+            invariants=invariants,
+        )
+        assert record.digest == _reference("e", record.input_state, record.output, invariants)
+
+
+def test_unencodable_output_still_rejected():
+    with pytest.raises(TypeError):
+        record_execution(engine="e", input_state={"x": 1}, output=object(), invariants={})
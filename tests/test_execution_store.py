@@ -0,0 +1,62 @@
+import os
+import pytest
+from spectrum.api.execute import execute
+from spectrum.logging import ExecutionLog
+
+
+def double(state):
+    return state["x"] * 2
+
+
+def test_log_deduplicates_and_looks_up(tmp_path):
+    with ExecutionLog(str(tmp_path)) as log:
+        r1 = execute("double", {"x": 1}, double, sink=log)
+        execute("double", {"x": 1}, double, sink=log)
+        r2 = execute("double", {"x": 2}, double, sink=log)
+
+        assert len(log) == 2
+        assert r1.digest in log
+        assert log.get(r2.digest) == r2
+        assert log.get("00" * 32) is None
+
+
+def test_log_survives_reopen_and_segments(tmp_path):
+    with ExecutionLog(str(tmp_path), segment_size=64, sync_every=2) as log:
+        records = [execute("double", {"x": i}, double, sink=log) for i in range(5)]
+
+    assert len([f for f in os.listdir(tmp_path) if f.startswith("segment-")]) > 1
+
+    with ExecutionLog(str(tmp_path)) as log:
+        assert tuple(log) == tuple(records)
+        assert not log.append(records[0])
+
+
+def test_log_detects_corruption(tmp_path):
+    with ExecutionLog(str(tmp_path)) as log:
+        record = execute("double", {"x": 3}, double, sink=log)
+
+    segment = tmp_path / "segment-000000.log"
+    segment.write_bytes(segment.read_bytes().replace(b'"output":6', b'"output":7'))
+
+    with ExecutionLog(str(tmp_path)) as log:
+        with pytest.raises(ValueError):
+            log.get(record.digest)
+
+
+def test_index_entries_past_segment_end_are_dropped(tmp_path):
+    with ExecutionLog(str(tmp_path)) as log:
+        records = [execute("double", {"x": i}, double, sink=log) for i in range(3)]
+
+    # Simulate a crash where the index reached disk but the segment tail did not.
+    segment = tmp_path / "segment-000000.log"
+    data = segment.read_bytes()
+    segment.write_bytes(data[:-5])
+
+    with ExecutionLog(str(tmp_path)) as log:
+        assert len(log) == 2
+        assert records[2].digest not in log
+        assert log.append(records[2])
+        assert log.get(records[2].digest) == records[2]
+
+    with ExecutionLog(str(tmp_path)) as log:
+        assert tuple(log) == tuple(records)
@@ -0,0 +1,74 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.expand.rules import (
+    expand_deterministically,
+    expand_deterministically_dedup,
+    merge_equivalent_nodes,
+)
+from spectrum.expansion.rules import expand_layer_dedup
+from spectrum.serialization.canonical import hash_nodes
+from spectrum.expansion.expander import LatticeExpander, add_constant_rule, append_rule
+
+
+def _layer():
+    return (
+        LatticeNode(id=4, state_vector=(Fraction(1, 2),), parents=set()),
+        LatticeNode(id=1, state_vector=(Fraction(2, 4),), parents=set()),
+        LatticeNode(id=3, state_vector=(Fraction(1),), parents=set()),
+    )
+
+
+def test_merge_unions_parents_and_keeps_smallest_id():
+    children = (
+        LatticeNode(id=9, state_vector=(Fraction(1),), parents={4}),
+        LatticeNode(id=3, state_vector=(Fraction(1),), parents={1}),
+        LatticeNode(id=7, state_vector=(Fraction(2),), parents={3}),
+    )
+    merged, collapsed = merge_equivalent_nodes(children)
+
+    assert collapsed == 1
+    assert [(n.id, n.parents) for n in merged] == [(3, {1, 4}), (7, {3})]
+    assert children[1].parents == {1}
+
+
+def test_dedup_add_constant_renumbers_canonically():
+    children, collapsed = expand_deterministically_dedup(_layer(), Fraction(1, 3))
+
+    assert [(n.id, n.state_vector, n.parents) for n in children] == [
+        (5, (Fraction(5, 6),), {1, 4}),
+        (6, (Fraction(4, 3),), {3}),
+    ]
+    assert collapsed == 1
+    assert len(expand_deterministically(_layer(), Fraction(1, 3))) == 3
+
+
+def test_dedup_append_rule():
+    children, collapsed = expand_layer_dedup(_layer())
+
+    assert [(n.id, n.parents) for n in children] == [(3, {1, 4}), (4, {3})]
+    assert collapsed == 1
+
+
+def test_expander_reports_collapsed_nodes():
+    expander = LatticeExpander(
+        _layer(), add_constant_rule(Fraction(1, 2)), max_depth=3, dedup=True
+    )
+    layers = list(expander)
+
+    assert [s.size for s in expander.stats] == [3, 2, 2, 2]
+    assert [s.collapsed for s in expander.stats] == [0, 1, 0, 0]
+    assert layers[1][0].parents == {1, 4}
+
+
+def test_expander_and_dedup_functions_agree_on_ids():
+    cases = (
+        (add_constant_rule(Fraction(1, 2)),
+         lambda layer: expand_deterministically_dedup(layer, Fraction(1, 2))),
+        (append_rule, expand_layer_dedup),
+    )
+    for rule, step in cases:
+        layers = list(LatticeExpander(_layer(), rule, max_depth=3, dedup=True))
+        layer = layers[0]
+        for expected in layers[1:]:
+            layer, _ = step(layer)
+            assert hash_nodes(layer) == hash_nodes(expected)
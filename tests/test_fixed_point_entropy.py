@@ -0,0 +1,102 @@
+from decimal import Decimal, getcontext
+from fractions import Fraction
+import numpy as np
+from spectrum.irreversibility.detect import Transition
+from spectrum.irreversibility.entropy import (
+    ENTROPY_ERROR_BOUND,
+    FRACTION_BITS,
+    LOG2_ERROR_BOUND,
+    _entropy_fixed_int,
+    _log2_fixed_int,
+    entropies_fixed,
+    entropy_shifts,
+    log2_fixed,
+    state_weights,
+)
+
+getcontext().prec = 60
+_LN2 = Decimal(2).ln()
+
+
+def _log2(x) -> Decimal:
+    return Decimal(x).ln() / _LN2
+
+
+def _entropy(state) -> Decimal:
+    total = sum(state)
+    return -sum(
+        (Decimal(x.numerator) / x.denominator / (Decimal(total.numerator) / total.denominator))
+        * _log2(Decimal(x.numerator) / x.denominator / (Decimal(total.numerator) / total.denominator))
+        for x in state
+        if x
+    )
+
+
+def _bound(f: Fraction) -> Decimal:
+    return Decimal(f.numerator) / f.denominator
+
+
+def test_log2_within_bound_and_matches_python_path():
+    values = list(range(1, 3000)) + [2**k + d for k in range(12, 62) for d in (-1, 1, 977)]
+    fixed = log2_fixed(np.array(values, dtype=np.int64)).tolist()
+
+    for v, l in zip(values, fixed):
+        assert l == _log2_fixed_int(v)
+        assert abs(Decimal(l) / (1 << FRACTION_BITS) - _log2(v)) <= _bound(LOG2_ERROR_BOUND)
+
+
+def test_state_weights_canonical():
+    assert state_weights((Fraction(1, 2), Fraction(1, 3), Fraction(0))) == (3, 2, 0)
+    assert state_weights((Fraction(4), Fraction(6))) == (2, 3)
+
+
+def test_vectorized_and_big_int_paths_agree():
+    states = [
+        (Fraction(9, 10), Fraction(1, 10)),
+        (Fraction(1, 3), Fraction(1, 3), Fraction(1, 3)),
+        (Fraction(2**40, 7), Fraction(1, 2**30), Fraction(5)),
+        (Fraction(1),),
+    ]
+    assert entropies_fixed(states) == tuple(
+        _entropy_fixed_int(state_weights(s)) for s in states
+    )
+
+
+def test_entropy_shift_within_bound():
+    transitions = [
+        Transition((Fraction(9, 10), Fraction(1, 10)), (Fraction(1, 2), Fraction(1, 2))),
+        Transition((Fraction(1, 7), Fraction(3, 7), Fraction(3, 7)), (Fraction(1), Fraction(0), Fraction(0))),
+        Transition((Fraction(2**50), Fraction(3)), (Fraction(1, 5), Fraction(2, 5), Fraction(2, 5))),
+    ]
+    for t, shift in zip(transitions, entropy_shifts(transitions)):
+        exact = _entropy(t.child_state) - _entropy(t.parent_state)
+        assert abs(Decimal(shift.numerator) / shift.denominator - exact) <= _bound(ENTROPY_ERROR_BOUND)
+
+
+def test_states_without_entropy_are_flagged_not_fatal():
+    from spectrum.irreversibility.detect import find_irreversible
+
+    states = [
+        (Fraction(0), Fraction(0)),
+        (),
+        (Fraction(-1, 2), Fraction(3)),
+        (Fraction(2**70), Fraction(-1)),
+        (Fraction(1, 2), Fraction(1, 2)),
+    ]
+    assert entropies_fixed(states)[:4] == (None, None, None, None)
+    assert entropies_fixed(states)[4] == 1 << FRACTION_BITS
+
+    good = Transition((Fraction(1), Fraction(0)), (Fraction(1, 2), Fraction(1, 2)))
+    bad = Transition((Fraction(0), Fraction(0)), (Fraction(1, 2), Fraction(1, 2)))
+    assert entropy_shifts([bad])[0] is None
+    assert find_irreversible([bad, good]) == (good,)
+
+
+def test_vectorized_weights_match_reference():
+    states = [
+        tuple(Fraction(1 + (i * k) % 11, 1 + (i + k) % 13) for k in range(1 + i % 5))
+        for i in range(300)
+    ] + [(Fraction(2**61, 3), Fraction(1, 2**40)), (Fraction(10**30), Fraction(1))]
+    assert entropies_fixed(states) == tuple(
+        _entropy_fixed_int(state_weights(s)) for s in states
+    )
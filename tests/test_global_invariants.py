@@ -4,6 +4,7 @@ from spectrum.invariants.global_invariants import (
     unique_node_ids,
     no_orphan_nodes,
     parents_are_acyclic,
+    check_global_invariants,
 )
 
 
@@ -26,3 +27,40 @@ def test_cycle_detected():
     ]
 
     assert not parents_are_acyclic(nodes)
+
+
+def test_deep_chain_does_not_recurse():
+    nodes = [
+        LatticeNode(id=i, state_vector=(Fraction(i),), parents={i - 1} if i else set())
+        for i in range(20000)
+    ]
+
+    assert parents_are_acyclic(nodes)
+    assert check_global_invariants(nodes).ok
+
+
+def test_generator_input_checked_once():
+    def gen():
+        yield LatticeNode(id=0, state_vector=(Fraction(0),), parents=set())
+        yield LatticeNode(id=1, state_vector=(Fraction(1),), parents={5})
+
+    assert not no_orphan_nodes(gen())
+    assert check_global_invariants(gen()).orphan_ids == (1,)
+
+
+def test_report_lists_offending_ids():
+    nodes = [
+        LatticeNode(id=0, state_vector=(Fraction(0),), parents=set()),
+        LatticeNode(id=1, state_vector=(Fraction(1),), parents={0, 3}),
+        LatticeNode(id=2, state_vector=(Fraction(2),), parents={1}),
+        LatticeNode(id=3, state_vector=(Fraction(3),), parents={2}),
+        LatticeNode(id=4, state_vector=(Fraction(4),), parents={3, 9}),
+        LatticeNode(id=4, state_vector=(Fraction(5),), parents={0}),
+    ]
+
+    report = check_global_invariants(nodes)
+
+    assert report.duplicate_ids == (4,)
+    assert report.orphan_ids == (4,)
+    assert report.cyclic_ids == (1, 2, 3)
+    assert not report.ok
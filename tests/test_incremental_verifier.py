@@ -0,0 +1,79 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.expansion.rules import expand_layer
+from spectrum.invariants.incremental import IncrementalLatticeVerifier
+from spectrum.invariants.proof import register_proof
+
+
+def _root():
+    return (LatticeNode(id=0, state_vector=(Fraction(0),), parents=set()),)
+
+
+def test_appended_layers_verified():
+    verifier = IncrementalLatticeVerifier(_root())
+    layer = _root()
+    for _ in range(5):
+        layer = expand_layer(layer)
+        assert verifier.append(layer)
+
+    assert len(verifier) == 6
+    assert 31 in verifier
+
+
+def test_invalid_delta_rejected_without_commit():
+    verifier = IncrementalLatticeVerifier(_root())
+
+    duplicate = (LatticeNode(id=0, state_vector=(Fraction(1),), parents=set()),)
+    orphan = (LatticeNode(id=1, state_vector=(Fraction(1),), parents={7}),)
+    cycle = (
+        LatticeNode(id=2, state_vector=(Fraction(1),), parents={0, 3}),
+        LatticeNode(id=3, state_vector=(Fraction(1),), parents={2}),
+    )
+
+    assert verifier.check(duplicate).duplicate_ids == (0,)
+    assert verifier.check(orphan).orphan_ids == (1,)
+    assert verifier.check(cycle).cyclic_ids == (2, 3)
+    assert not verifier.append(cycle)
+    assert len(verifier) == 1
+
+
+def test_incremental_proof_sees_only_delta():
+    seen = []
+
+    def full(nodes):
+        return True
+
+    def incremental(state, delta):
+        seen.append((len(state), tuple(n.id for n in delta)))
+        return True
+
+    register_proof("incremental_delta_only", full, incremental=incremental)
+
+    verifier = IncrementalLatticeVerifier(_root())
+    verifier.append(expand_layer(_root()))
+
+    assert seen[-1] == (1, (1,))
+
+
+def test_nodes_view_and_cached_snapshot():
+    seen = []
+
+    def full(nodes):
+        seen.append(nodes)
+        return True
+
+    register_proof("full_node_set_snapshot", full)
+
+    verifier = IncrementalLatticeVerifier(_root())
+    view = verifier.nodes
+    layer = _root()
+    for _ in range(3):
+        layer = expand_layer(layer)
+        assert verifier.append(layer)
+
+    assert verifier.nodes is view and len(view) == 4
+    assert [n.id for n in view] == [0, 1, 3, 7]
+    assert not hasattr(view, "append")
+    assert seen[-1] == tuple(view)
+    # The tuple built for the last append is reused as the snapshot.
+    assert verifier._snapshot is seen[-1]
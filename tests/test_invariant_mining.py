@@ -33,3 +33,51 @@ def test_determinism():
     r1 = mine(states)
     r2 = mine(states)
     assert r1 == r2
+
+
+def _reference(states):
+    states = tuple(states)
+    dim = len(states[0])
+    inv = set()
+    for i in range(dim):
+        values = {s[i] for s in states}
+        if len(values) == 1:
+            inv.add(("const", (i,), (values.pop(),)))
+    for i in range(dim):
+        for j in range(i + 1, dim):
+            if all(s[i] == s[j] for s in states):
+                inv.add(("equal", (i, j), ()))
+    return inv
+
+
+def test_columnar_miner_matches_reference():
+    states = [
+        tuple(Fraction((k * (i % 3)) % 4, 1 + i % 2) if i != 4 else Fraction(7) for i in range(8))
+        for k in range(1, 6)
+    ]
+    inv = mine(states)
+
+    assert inv == _reference(states)
+    assert ("const", (4,), (Fraction(7),)) in inv
+    assert ("equal", (0, 3), ()) in inv
+    assert mine([]) == set()
+
+
+def test_miner_accepts_non_rational_states():
+    states = [
+        (0.5, k * 1.5, 0.5, "tag", k * 1.5)
+        for k in range(4)
+    ]
+    inv = mine(states)
+
+    assert inv == _reference(states)
+    assert ("const", (3,), ("tag",)) in inv
+    assert ("equal", (1, 4), ()) in inv
+
+
+def test_nan_columns_satisfy_no_invariant():
+    nan = float("nan")
+    for states in ([(nan, nan)], [(nan, nan, 1.0), (nan, nan, 1.0)]):
+        inv = mine(states)
+        assert not any(0 in dims or 1 in dims for _, dims, _ in inv)
+    assert mine([(nan, nan, 1.0), (nan, nan, 1.0)]) == {("const", (2,), (1.0,))}
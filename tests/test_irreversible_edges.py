@@ -0,0 +1,32 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.expansion.rules import expand_layer
+from spectrum.irreversibility.edges import IrreversibleEdgeIndex, find_irreversible_edges
+
+
+def _node(i, value, parents=()):
+    return LatticeNode(id=i, state_vector=(Fraction(value),), parents=set(parents))
+
+
+def test_edges_sorted_and_equal_states_skipped():
+    nodes = [
+        _node(3, 1, (1,)),
+        _node(2, 0, (0,)),
+        _node(1, 0, (0,)),
+        _node(0, 0),
+    ]
+    assert find_irreversible_edges(nodes) == ((1, 3),)
+
+
+def test_incremental_layers_and_late_parents():
+    root = (LatticeNode(id=0, state_vector=(Fraction(0),), parents=set()),)
+    index = IrreversibleEdgeIndex(root)
+
+    layer = expand_layer(root)
+    assert index.add(layer) == ((0, 1),)
+    assert index.add(expand_layer(layer)) == ((1, 3),)
+
+    late = IrreversibleEdgeIndex([_node(9, 2, (8,))])
+    assert late.edges() == ()
+    assert late.add([_node(8, 1)]) == ((8, 9),)
+    assert (8, 9) in late
@@ -0,0 +1,67 @@
+from fractions import Fraction
+import os
+import itertools
+from spectrum.lattice.node import LatticeNode
+from spectrum.expand.rules import expand_deterministically
+from spectrum.expansion.rules import expand_layer
+from spectrum.expansion.expander import (
+    LatticeExpander,
+    add_constant_rule,
+    append_rule,
+)
+from spectrum.serialization.canonical import hash_nodes, serialize_nodes
+
+
+def _seed():
+    return (
+        LatticeNode(id=2, state_vector=(Fraction(1, 2),), parents=set()),
+        LatticeNode(id=0, state_vector=(Fraction(0),), parents=set()),
+    )
+
+
+def _ticks():
+    counter = itertools.count(0, 5)
+    return lambda: next(counter)
+
+
+def test_expander_matches_manual_loop():
+    layers = list(LatticeExpander(_seed(), append_rule, max_depth=3))
+
+    expected = [tuple(sorted(_seed(), key=lambda n: n.id))]
+    for _ in range(3):
+        expected.append(expand_layer(expected[-1]))
+    assert layers == expected
+
+
+def test_add_constant_rule_and_stats():
+    expander = LatticeExpander(
+        _seed(), add_constant_rule(Fraction(1, 3)), max_depth=2, clock=_ticks()
+    )
+    layers = list(expander)
+
+    assert layers[1] == expand_deterministically(_seed(), Fraction(1, 3))
+    assert [(s.depth, s.size, s.elapsed_ns) for s in expander.stats] == [
+        (0, 2, 0), (1, 2, 5), (2, 2, 5),
+    ]
+    assert expander.total_nodes == 6
+
+
+def test_node_budget_stops_before_overflow():
+    expander = LatticeExpander(_seed(), max_nodes=5)
+    layers = list(expander)
+
+    assert len(layers) == 2
+    assert expander.total_nodes == 4
+
+
+def test_layers_spill_in_canonical_form(tmp_path):
+    expander = LatticeExpander(_seed(), max_depth=2, spill_dir=str(tmp_path))
+    layers = list(expander)
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "layer-000000.txt", "layer-000001.txt", "layer-000002.txt",
+    ]
+    for layer, stats in zip(layers, expander.stats):
+        with open(stats.path) as f:
+            assert tuple(f.read().splitlines()) == serialize_nodes(layer)
+        assert stats.digest == hash_nodes(layer)
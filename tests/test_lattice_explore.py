@@ -0,0 +1,50 @@
+from fractions import Fraction
+from spectrum.lattice.expand import expand, explore
+from spectrum.lattice.state import LatticeState
+
+
+def test_expand_yields_canonical_successors():
+    s = LatticeState((Fraction(1, 2), Fraction(0)))
+    result = tuple(expand(s, steps=(Fraction(1), Fraction(-1), 1)))
+
+    assert result == (
+        LatticeState((Fraction(-1, 2), Fraction(0))),
+        LatticeState((Fraction(3, 2), Fraction(0))),
+        LatticeState((Fraction(1, 2), Fraction(-1))),
+        LatticeState((Fraction(1, 2), Fraction(1))),
+    )
+    assert tuple(expand((Fraction(1, 2), Fraction(0)))) == (
+        LatticeState((Fraction(3, 2), Fraction(0))),
+        LatticeState((Fraction(1, 2), Fraction(1))),
+    )
+
+
+def test_explore_visits_each_state_once_in_bfs_order():
+    states = list(explore((Fraction(0), Fraction(0)), max_depth=2))
+
+    assert [s.value for s in states] == [
+        (0, 0),
+        (1, 0), (0, 1),
+        (2, 0), (1, 1), (0, 2),
+    ]
+
+
+def test_explore_respects_state_budget():
+    steps = (Fraction(-1), Fraction(1))
+    states = list(explore((Fraction(0),) * 3, steps, max_states=50))
+
+    assert len(states) == 50
+    assert len(set(states)) == 50
+    assert states == list(explore((Fraction(0),) * 3, steps, max_states=50))
+    for k in (1, 2):
+        assert len(list(explore((Fraction(0), Fraction(0)), max_states=k))) == k
+
+
+def test_explore_skips_states_already_visited():
+    start = (Fraction(0), Fraction(0))
+    visited = {(Fraction(1), Fraction(0))}
+    states = [s.value for s in explore(start, max_depth=1, visited=visited)]
+
+    assert states == [(0, 0), (0, 1)]
+    assert visited == {(0, 0), (1, 0), (0, 1)}
+    assert list(explore(start, visited=visited)) == []
@@ -0,0 +1,66 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.store import LatticeStore
+from spectrum.expansion.rules import expand_layer, expand_store
+from spectrum.serialization.canonical import (
+    serialize_nodes,
+    hash_nodes,
+    serialize_store,
+    hash_store,
+)
+from spectrum.invariants.global_invariants import (
+    unique_node_ids,
+    no_orphan_nodes,
+    parents_are_acyclic,
+)
+
+
+def _nodes():
+    return (
+        LatticeNode(id=3, state_vector=(Fraction(1, 2), Fraction(2)), parents={1, 0}),
+        LatticeNode(id=0, state_vector=(Fraction(0),), parents=set()),
+        LatticeNode(id=1, state_vector=(Fraction(1, 2),), parents={0}),
+    )
+
+
+def test_store_materializes_nodes():
+    nodes = _nodes()
+    store = LatticeStore.from_nodes(nodes)
+
+    assert len(store) == 3
+    assert tuple(store) == nodes
+    assert store.get(1) == nodes[2]
+    assert store[-1] == nodes[2]
+    assert store.parents(0) == (0, 1)
+
+
+def test_store_interns_values():
+    store = LatticeStore.from_nodes(_nodes())
+    assert store.numerators == [1, 2, 0]
+    assert store.denominators == [2, 1, 1]
+
+
+def test_store_serialization_matches_nodes():
+    nodes = _nodes()
+    store = LatticeStore.from_nodes(nodes)
+
+    assert serialize_store(store) == serialize_nodes(nodes)
+    assert hash_store(store) == hash_nodes(nodes)
+
+
+def test_store_expansion_matches_expand_layer():
+    nodes = _nodes()
+    expanded = expand_store(LatticeStore.from_nodes(nodes))
+
+    assert tuple(expanded) == expand_layer(nodes)
+    assert hash_store(expanded) == hash_nodes(expand_layer(nodes))
+
+
+def test_global_invariants_on_store():
+    store = LatticeStore.from_nodes(_nodes())
+    assert unique_node_ids(store)
+    assert no_orphan_nodes(store)
+    assert parents_are_acyclic(store)
+
+    store.append(7, (Fraction(1),), (9,))
+    assert not no_orphan_nodes(store)
@@ -0,0 +1,74 @@
+from fractions import Fraction
+import hashlib
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.logging import batch_digest
+from spectrum.serialization.canonical import hash_nodes, serialize_node
+from spectrum.serialization.merkle import (
+    MerkleLattice,
+    lattice_digests,
+    merkle_root,
+    verify_inclusion,
+)
+
+
+def _nodes(count):
+    return [
+        LatticeNode(
+            id=i,
+            state_vector=(Fraction(i, 3),),
+            parents={i - 1} if i else set(),
+        )
+        for i in range(count)
+    ]
+
+
+def test_incremental_root_matches_batch_root():
+    nodes = _nodes(37)
+    tree = MerkleLattice()
+    for size, n in enumerate(nodes, start=1):
+        tree.append(n)
+        lines = [serialize_node(m).encode("utf-8") for m in nodes[:size]]
+        assert tree.root() == merkle_root(lines).hex()
+
+    assert tree.root(0) == merkle_root([]).hex()
+    assert MerkleLattice.from_nodes(reversed(nodes)).root() == tree.root()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 37])
+def test_inclusion_proofs_verify(size):
+    nodes = _nodes(37)
+    tree = MerkleLattice.from_nodes(nodes)
+    root = tree.root(size)
+
+    for i in range(size):
+        proof = tree.inclusion_proof(i, size)
+        line = serialize_node(nodes[i])
+        assert len(proof) <= size.bit_length()
+        assert verify_inclusion(line, i, size, proof, root)
+        assert not verify_inclusion(line + "x", i, size, proof, root)
+        if size > 1:
+            assert not verify_inclusion(line, (i + 1) % size, size, proof, root)
+
+
+def test_digests_report_flat_hash_alongside_merkle_root():
+    nodes = _nodes(10)
+    digests = lattice_digests(nodes)
+    tree = MerkleLattice.from_nodes(nodes)
+
+    assert digests.flat == hash_nodes(nodes)
+    assert digests.merkle == tree.root()
+    assert tree.index(4) == 4
+    with pytest.raises(KeyError):
+        tree.index(99)
+    with pytest.raises(ValueError):
+        tree.append(nodes[0])
+
+
+def test_batch_digest_is_pinned():
+    digests = [hashlib.sha256(bytes([i])).hexdigest() for i in range(5)]
+
+    assert batch_digest(digests) == (
+        "6b313b611b40676b9e1dfd70c4503f2379f88f0f1c2740fb7e1cacc32c113465"
+    )
+    assert batch_digest([]) == hashlib.sha256(b"").hexdigest()
@@ -0,0 +1,63 @@
+from fractions import Fraction
+from spectrum.invariant.mine import mine
+from spectrum.invariant.online import OnlineInvariantMiner
+
+
+def _states():
+    return [
+        (Fraction(1), Fraction(k % 2), Fraction(k % 2), Fraction(3, 4), Fraction(k))
+        for k in range(6)
+    ] + [(Fraction(1), Fraction(0), Fraction(0), Fraction(3, 4), Fraction(0))]
+
+
+def test_online_matches_batch_at_every_prefix():
+    states = _states()
+    miner = OnlineInvariantMiner()
+    assert miner.invariants() == set()
+
+    for n, state in enumerate(states, start=1):
+        miner.update(state)
+        assert miner.invariants() == mine(states[:n])
+
+
+def test_checkpoint_resume():
+    states = _states()
+    first = OnlineInvariantMiner()
+    first.update_many(states[:3])
+
+    resumed = OnlineInvariantMiner.from_checkpoint(first.checkpoint())
+    resumed.update_many(states[3:])
+
+    assert len(resumed) == len(states)
+    assert resumed.invariants() == mine(states)
+
+
+def test_online_matches_batch_on_float_states():
+    states = [(0.5, k * 1.5, k * 1.5, -0.0) for k in range(4)]
+    miner = OnlineInvariantMiner()
+    miner.update_many(states)
+
+    assert miner.invariants() == mine(states)
+
+
+def test_online_matches_batch_on_mixed_numeric_states():
+    cases = [
+        [(1, 1.0)],
+        [(Fraction(1, 2), 0.5)],
+        [(Fraction(1), 1.0, "a")],
+        [(2, 2.0, Fraction(2), float("inf"), float("inf"))],
+        [(0.1, Fraction(1, 10), 0.1), (0.1, Fraction(1, 10), 0.1)],
+    ]
+    for states in cases:
+        miner = OnlineInvariantMiner()
+        miner.update_many(states)
+        assert miner.invariants() == mine(states)
+    assert ("equal", (0, 1), ()) in mine([(1, 1.0)])
+
+
+def test_online_matches_batch_with_nan():
+    nan = float("nan")
+    for states in ([(nan, nan)], [(nan, 1.0, nan), (nan, 1.0, nan)]):
+        miner = OnlineInvariantMiner()
+        miner.update_many(states)
+        assert miner.invariants() == mine(states)
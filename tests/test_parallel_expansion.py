@@ -0,0 +1,54 @@
+from fractions import Fraction
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.expand.rules import expand_deterministically
+from spectrum.expansion.rules import expand_layer
+from spectrum.expansion.parallel import (
+    expand_deterministically_parallel,
+    expand_layer_parallel,
+)
+from spectrum.serialization.canonical import serialize_nodes
+
+
+def _layer():
+    # Unsorted, with a duplicate id, to exercise stable ordering.
+    ids = [7, 3, 11, 0, 3, 5, 9, 2]
+    return tuple(
+        LatticeNode(
+            id=i,
+            state_vector=(Fraction(k, 3), Fraction(i)),
+            parents={i - 1} if i else set(),
+        )
+        for k, i in enumerate(ids)
+    )
+
+
+def _lines(nodes):
+    return tuple(serialize_nodes(nodes)), tuple(n.transition_rule for n in nodes)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_parallel_layer_matches_serial(workers):
+    layer = _layer()
+
+    assert expand_layer_parallel(layer, workers) == expand_layer(layer)
+    assert _lines(expand_layer_parallel(layer, workers)) == _lines(expand_layer(layer))
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 8])
+def test_parallel_add_constant_matches_serial(workers):
+    layer = _layer()
+    constant = Fraction(2, 5)
+
+    parallel = expand_deterministically_parallel(layer, constant, workers)
+    serial = expand_deterministically(layer, constant)
+    assert parallel == serial
+    assert [n.id for n in parallel] == list(range(12, 12 + len(layer)))
+
+
+def test_parallel_expansion_rejects_bad_input():
+    with pytest.raises(ValueError):
+        expand_layer_parallel(_layer(), workers=0)
+    with pytest.raises(ValueError):
+        expand_deterministically_parallel((), Fraction(1), workers=2)
+    assert expand_layer_parallel((), workers=2) == ()
@@ -0,0 +1,26 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.serialization.canonical import serialize_node
+from spectrum.replay.replay import replay_nodes, replay_nodes_parallel
+
+
+def test_parallel_replay_matches_serial(tmp_path):
+    nodes = [
+        LatticeNode(id=(i * 13) % 37, state_vector=(Fraction(i, 7), Fraction(-i)), parents={i % 5})
+        for i in range(60)
+    ]
+    lines = [serialize_node(n) for n in nodes]
+    path = tmp_path / "lattice.txt"
+    path.write_text("".join(l + "\n" for l in lines))
+
+    expected = replay_nodes(lines)
+    for workers in (1, 2, 3, 8):
+        assert replay_nodes_parallel(str(path), workers=workers) == expected
+
+
+def test_parallel_replay_more_workers_than_lines(tmp_path):
+    line = serialize_node(LatticeNode(id=4, state_vector=(Fraction(1),), parents=set()))
+    path = tmp_path / "single.txt"
+    path.write_text(line + "\n")
+
+    assert replay_nodes_parallel(str(path), workers=4) == replay_nodes([line])
@@ -0,0 +1,80 @@
+import pickle
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.pvector import PersistentVector
+from spectrum.expansion.rules import expand_layer
+from spectrum.serialization.canonical import hash_nodes, serialize_node
+
+
+def test_vector_matches_tuple_across_trie_levels():
+    for n in (0, 1, 32, 33, 1056, 1057, 40000):
+        built = PersistentVector()
+        for i in range(n):
+            built = built.append(i)
+        expected = tuple(range(n))
+
+        assert built == expected and expected == built
+        assert PersistentVector(expected) == built
+        assert hash(built) == hash(expected)
+        assert tuple(built) == expected
+        assert [built[i] for i in range(0, n, 97)] == list(expected[::97])
+        if n:
+            assert built[-1] == n - 1
+            assert built[1:5] == expected[1:5]
+
+
+def test_append_is_persistent():
+    base = PersistentVector(range(64))
+    a = base.append("a")
+    b = base.append("b")
+
+    assert len(base) == 64
+    assert a[64] == "a" and b[64] == "b"
+    assert base + (1, 2) == tuple(range(64)) + (1, 2)
+    assert (0,) + PersistentVector((1,)) == (0, 1)
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_tuple_api():
+    v = PersistentVector(range(40)).append(3)
+
+    assert v.index(3) == 3 and v.index(3, 4) == 40
+    assert v.count(3) == 2
+    assert v * 2 == 2 * v == tuple(v) * 2
+    assert 39 in v and 41 not in v
+    assert list(reversed(v)) == list(reversed(tuple(v)))
+
+
+def test_expansion_keeps_tuple_states_plain():
+    node = LatticeNode(id=0, state_vector=(Fraction(1, 2),), parents=set())
+    child = expand_layer((node,))[0]
+
+    assert type(child.state_vector) is tuple
+    assert child.state_vector == (Fraction(1, 2), Fraction(1))
+
+
+def test_deep_chain_serializes_like_tuples():
+    node = LatticeNode(
+        id=0, state_vector=PersistentVector((Fraction(1, 2),)), parents=set()
+    )
+    chain = [node]
+    for _ in range(200):
+        node = expand_layer((node,))[0]
+        chain.append(node)
+
+    plain = [
+        LatticeNode(id=n.id, state_vector=tuple(n.state_vector), parents=n.parents)
+        for n in chain
+    ]
+    assert isinstance(chain[-1].state_vector, PersistentVector)
+    assert serialize_node(chain[-1]) == serialize_node(plain[-1])
+    assert hash_nodes(chain) == hash_nodes(plain)
+    assert chain == plain
+
+
+def test_ordering_interoperates_with_tuples():
+    one, two = PersistentVector((1,)), PersistentVector((2,))
+
+    assert (1,) < two and two > (1,) and (2,) >= two and (3,) > two
+    assert one <= one and one >= (1,) and not one > (1,)
+    assert sorted([two, (0,), one]) == [(0,), (1,), (2,)]
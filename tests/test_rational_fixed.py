@@ -0,0 +1,76 @@
+from fractions import Fraction
+import itertools
+import pickle
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.metrics.fairness import demographic_parity
+from spectrum.rational.fixed import Rational
+from spectrum.serialization.canonical import hash_nodes
+
+VALUES = [Fraction(0), Fraction(1), Fraction(-3, 4), Fraction(5, 6), Fraction(-2), Fraction(1, 6)]
+
+
+def test_arithmetic_matches_fraction():
+    for a, b in itertools.product(VALUES, repeat=2):
+        ra, rb = Rational(a), Rational(b)
+        for result, expected in (
+            (ra + rb, a + b), (ra - b, a - b), (a - rb, a - b),
+            (ra * rb, a * b), (ra + int(b), a + int(b)),
+        ):
+            assert result == expected and expected == result
+            assert hash(result) == hash(expected)
+            assert result.to_fraction() == expected
+        if b:
+            assert ra / rb == a / b and a / rb == a / b
+        assert (ra < rb, ra <= b, a > rb, ra >= rb) == (a < b, a <= b, a > b, a >= b)
+
+
+def test_normalization_is_lazy_and_exact():
+    third = Rational(1, 3)
+    total = third + third + third
+
+    assert total._den == 3 and not total._reduced
+    assert (total.numerator, total.denominator) == (1, 1)
+    assert Rational(2, -4) == Fraction(-1, 2)
+    assert str(Rational(6, 4)) == "3/2" and repr(Rational(6, 4)) == "Rational(3, 2)"
+    assert pickle.loads(pickle.dumps(Rational(2, 4))) == Fraction(1, 2)
+    with pytest.raises(ZeroDivisionError):
+        Rational(1, 0)
+    with pytest.raises(ZeroDivisionError):
+        Rational(1) / 0
+
+
+def test_rational_states_serialize_like_fractions():
+    fractions = (Fraction(1, 2) + Fraction(1, 2), Fraction(-5, 6))
+    rationals = (Rational(1, 2) + Rational(1, 2), Rational(-5, 6))
+
+    assert hash_nodes([LatticeNode(id=0, state_vector=rationals, parents=set())]) == \
+        hash_nodes([LatticeNode(id=0, state_vector=fractions, parents=set())])
+
+
+def test_numbers_rational_interface_matches_fraction():
+    import math
+    import numbers
+
+    assert isinstance(Rational(1, 2), numbers.Rational)
+    for a in (Fraction(7, 2), Fraction(-7, 2), Fraction(5, 3), Fraction(0)):
+        r = Rational(a)
+        assert (int(r), math.floor(r), math.ceil(r), round(r)) == \
+            (int(a), math.floor(a), math.ceil(a), round(a))
+        assert round(r, 1) == round(a, 1)
+        assert r ** 2 == a ** 2 and r ** 0 == 1
+        if a:
+            assert r ** -3 == a ** -3
+        for b in (Fraction(2), Fraction(-1, 3), Fraction(5, 4)):
+            assert r // Rational(b) == a // b and r % b == a % b
+            assert divmod(r, b) == divmod(a, b) and 3 % Rational(b) == 3 % b
+    assert Rational(4) ** Fraction(1, 2) == 2
+
+
+def test_demographic_parity_with_rational_rates():
+    outputs = [1, 0, 1, 1, 0, 0]
+    groups = ["a", "a", "b", "b", "b", "c"]
+    rational = demographic_parity([Rational(o) for o in outputs], groups, rate=Rational)
+
+    assert rational == demographic_parity(outputs, groups)
+    assert all(type(r) is Rational for r in rational.values())
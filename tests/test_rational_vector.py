@@ -0,0 +1,87 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.expand.rules import (
+    expand_deterministically,
+    expand_deterministically_vectorized,
+)
+from spectrum.rational.fixed import Rational
+from spectrum.rational.vector import RationalVector
+from spectrum.serialization.canonical import serialize_nodes
+
+STATES = [
+    (Fraction(1, 2), Fraction(1, 3), Fraction(0)),
+    (Fraction(-5, 6), Fraction(7), Fraction(2, 9)),
+]
+
+
+def test_round_trip_and_canonical_form():
+    v = RationalVector.from_states(STATES)
+
+    assert v.shape == (2, 3)
+    assert v.denominator == 18
+    assert v.to_tuples() == tuple(STATES)
+    assert RationalVector.from_values(STATES[0]).to_tuples() == STATES[0]
+    assert RationalVector([2, 4], 4) == RationalVector([1, 2], 2)
+
+
+def test_elementwise_add_scale_compare_are_exact():
+    v = RationalVector.from_states(STATES)
+
+    assert (v + Fraction(1, 6)).to_tuples() == tuple(
+        tuple(x + Fraction(1, 6) for x in s) for s in STATES
+    )
+    assert (v + v).to_tuples() == tuple(tuple(2 * x for x in s) for s in STATES)
+    assert (1 - v).to_tuples() == tuple(tuple(1 - x for x in s) for s in STATES)
+    assert v.scale(Rational(3, 2)).to_tuples() == tuple(
+        tuple(x * Fraction(3, 2) for x in s) for s in STATES
+    )
+    assert v.compare(Fraction(1, 3)).tolist() == [[1, 0, -1], [-1, 1, -1]]
+
+
+def test_overflow_falls_back_to_python_ints_and_back():
+    v = RationalVector.from_states(STATES)
+    huge = Fraction(2**70, 3)
+    big = v + huge
+
+    assert big.numerators.dtype == object
+    assert big.to_tuples() == tuple(tuple(x + huge for x in s) for s in STATES)
+    assert (big - huge).numerators.dtype == np.int64
+    assert big - huge == v
+
+
+def test_vectorized_layer_expansion_matches_serial():
+    layer = [
+        LatticeNode(id=i, state_vector=STATES[i % 2], parents=set())
+        for i in (4, 1, 7)
+    ]
+    constant = Fraction(5, 12)
+    vectorized = expand_deterministically_vectorized(layer, constant)
+    serial = expand_deterministically(layer, constant)
+
+    assert vectorized == serial
+    assert serialize_nodes(vectorized) == serialize_nodes(serial)
+
+    ragged = layer + [LatticeNode(id=9, state_vector=(Fraction(1),), parents=set())]
+    assert expand_deterministically_vectorized(ragged, constant) == \
+        expand_deterministically(ragged, constant)
+
+
+def test_rejects_invalid_input():
+    with pytest.raises(ZeroDivisionError):
+        RationalVector([1], 0)
+    with pytest.raises(ValueError):
+        RationalVector.from_states([(Fraction(1),), ()])
+
+
+def test_large_factors_on_zero_operands():
+    tiny = Fraction(1, 2**70)
+
+    assert (RationalVector.from_states([(0, 0)]) + tiny).to_tuples() == ((tiny, tiny),)
+    assert RationalVector([0, 0]).scale(2**70).to_tuples() == (Fraction(0), Fraction(0))
+    assert RationalVector([1, 0]).scale(2**70).to_tuples() == (Fraction(2**70), Fraction(0))
+
+    zeros = [LatticeNode(id=0, state_vector=(Fraction(0), Fraction(0)), parents=set())]
+    assert expand_deterministically_vectorized(zeros, tiny) == \
+        expand_deterministically(zeros, tiny)
@@ -0,0 +1,73 @@
+from fractions import Fraction
+import pickle
+from spectrum.lattice.node import LatticeNode
+from spectrum.serialization import canonical
+from spectrum.serialization.canonical import (
+    clear_serialization_cache,
+    hash_nodes,
+    serialization_cache_info,
+    serialize_node,
+)
+
+
+def _reference(node):
+    parents = ",".join(str(p) for p in sorted(node.parents))
+    state = ",".join(f"{x.numerator}/{x.denominator}" for x in node.state_vector)
+    return f"id={node.id}|state={state}|parents={parents}"
+
+
+def _nodes():
+    return [
+        LatticeNode(
+            id=i,
+            state_vector=(Fraction(i % 4, 3), Fraction(-10**40, 7)),
+            parents={i - 1, i - 2} if i > 1 else set(),
+        )
+        for i in range(20)
+    ]
+
+
+def test_cached_lines_match_reference_bytes():
+    nodes = _nodes()
+    first = [serialize_node(n) for n in nodes]
+    second = [serialize_node(n) for n in nodes]
+
+    assert first == second == [_reference(n) for n in nodes]
+    assert pickle.loads(pickle.dumps(nodes)) == nodes
+
+
+def test_cache_metrics_count_hits_and_misses():
+    clear_serialization_cache()
+    nodes = _nodes()
+    hash_nodes(nodes)
+    hash_nodes(nodes)
+    info = serialization_cache_info()
+
+    assert (info.line_hits, info.line_misses, info.line_size) == (20, 20, 20)
+    # Four distinct first components and one shared second component.
+    assert info.fraction_misses == 5
+    assert info.fraction_hits == 35
+    assert info.fraction_size == 5
+
+    clear_serialization_cache()
+    assert serialization_cache_info() == (0, 0, 0, 0, 0, 0)
+
+
+def test_cached_lines_follow_mutated_parents():
+    parents = {2, 1}
+    node = LatticeNode(id=3, state_vector=(Fraction(1),), parents=parents)
+    assert serialize_node(node) == "id=3|state=1/1|parents=1,2"
+
+    parents.add(0)
+    assert serialize_node(node) == _reference(node) == "id=3|state=1/1|parents=0,1,2"
+    assert "_canonical_line" not in node.__dict__
+
+
+def test_line_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(canonical, "LINE_CACHE_SIZE", 8)
+    clear_serialization_cache()
+    nodes = _nodes()
+    hash_nodes(nodes)
+
+    assert serialization_cache_info().line_size == 8
+    assert [serialize_node(n) for n in nodes] == [_reference(n) for n in nodes]
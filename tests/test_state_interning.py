@@ -0,0 +1,77 @@
+from fractions import Fraction
+from spectrum.lattice.node import LatticeNode
+from spectrum.lattice.intern import InternTable
+from spectrum.expand.rules import apply_rule_add_constant, expand_deterministically
+from spectrum.expansion.rules import expand_layer
+from spectrum.serialization.canonical import hash_nodes
+
+
+def test_equal_states_share_one_object():
+    table = InternTable()
+    a = table.state((Fraction(1, 2), Fraction(3)))
+    b = table.state([Fraction(2, 4), Fraction(3)])
+
+    assert a is b
+    assert a == (Fraction(1, 2), Fraction(3))
+    assert hash(a) == hash((Fraction(1, 2), Fraction(3)))
+    assert a[0] is table.fraction(Fraction(1, 2))
+    assert table.stats().hits == 1 and table.stats().misses == 1
+
+
+def test_interned_fraction_behaves_like_fraction():
+    table = InternTable()
+    x = table.fraction(Fraction(3, 4))
+
+    assert x == Fraction(3, 4) and hash(x) == hash(Fraction(3, 4))
+    assert type(x + 1) is Fraction
+    assert table.fraction(Fraction(6, 8)) is x
+
+
+def test_non_fraction_components_pass_through():
+    table = InternTable()
+    mixed = table.state((1, 0.5, Fraction(1, 2)))
+
+    assert type(mixed[0]) is int and type(mixed[1]) is float
+    assert table.state((1.0, 0.5, Fraction(1, 2))) is not mixed
+    assert table.state((1, 0.5, Fraction(2, 4))) is mixed
+
+
+def test_add_constant_keeps_int_and_float_states():
+    ints = LatticeNode(id=0, state_vector=(1, 2), parents=set())
+    floats = LatticeNode(id=1, state_vector=(0.5,), parents=set())
+
+    for table in (None, InternTable()):
+        child = apply_rule_add_constant(ints, 1, next_id=2, table=table)
+        assert child.state_vector == (2, 3)
+        assert all(type(x) is int for x in child.state_vector)
+        child = apply_rule_add_constant(floats, 0.25, next_id=3, table=table)
+        assert child.state_vector == (0.75,)
+
+
+def test_expansion_shares_equal_child_states():
+    nodes = (
+        LatticeNode(id=0, state_vector=(Fraction(1),), parents=set()),
+        LatticeNode(id=1, state_vector=(Fraction(2, 2),), parents={0}),
+    )
+    table = InternTable()
+    added = expand_deterministically(nodes, Fraction(1, 3), table=table)
+    appended = expand_layer(nodes, table=table)
+
+    assert added[0].state_vector is added[1].state_vector
+    assert appended[0].state_vector is appended[1].state_vector
+    assert table.state(added[0].state_vector) is added[0].state_vector
+    assert hash_nodes(added) == hash_nodes(expand_deterministically(nodes, Fraction(1, 3)))
+
+
+def test_interned_vectors_share_prefixes_and_children():
+    table = InternTable()
+    root = LatticeNode(id=0, state_vector=(Fraction(1, 2),), parents=set())
+    chain = [root]
+    for _ in range(40):
+        chain.append(expand_layer((chain[-1],), table=table)[0])
+
+    again = expand_layer((chain[-2],), table=table)[0]
+    assert again.state_vector is chain[-1].state_vector
+    assert table.vector(chain[-1].state_vector) is chain[-1].state_vector
+    assert table.vector(tuple(chain[-1].state_vector)) is chain[-1].state_vector
+    assert chain[-1].state_vector == (Fraction(1, 2),) + (Fraction(1),) * 40
@@ -0,0 +1,46 @@
+import io
+from fractions import Fraction
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.serialization.canonical import (
+    serialize_nodes,
+    hash_nodes,
+    iter_serialize_nodes,
+    hash_nodes_stream,
+    write_nodes,
+)
+
+
+def _nodes():
+    return [
+        LatticeNode(id=(i * 7) % 11, state_vector=(Fraction(i, 3),), parents={i} if i % 2 else set())
+        for i in range(11)
+    ] + [LatticeNode(id=4, state_vector=(Fraction(9),), parents=set())]
+
+
+def test_external_sort_matches_serialize_nodes():
+    nodes = _nodes()
+    expected = serialize_nodes(nodes)
+
+    assert tuple(iter_serialize_nodes(nodes)) == expected
+    assert tuple(iter_serialize_nodes(iter(nodes), run_size=3)) == expected
+    assert hash_nodes_stream(iter(nodes), run_size=2) == hash_nodes(nodes)
+
+
+def test_presorted_stream():
+    nodes = sorted(_nodes(), key=lambda n: n.id)
+
+    assert tuple(iter_serialize_nodes(iter(nodes), presorted=True)) == serialize_nodes(nodes)
+
+    with pytest.raises(ValueError):
+        tuple(iter_serialize_nodes(reversed(nodes), presorted=True))
+
+
+def test_write_nodes_bytes_and_digest():
+    nodes = _nodes()
+    buf = io.BytesIO()
+
+    digest = write_nodes(nodes, buf, run_size=4)
+
+    assert buf.getvalue() == "".join(l + "\n" for l in serialize_nodes(nodes)).encode()
+    assert digest == hash_nodes(nodes)
@@ -0,0 +1,87 @@
+from fractions import Fraction
+import pytest
+from spectrum.lattice.node import LatticeNode
+from spectrum.replay.replay import (
+    parse_fraction,
+    parse_node,
+    parse_state,
+    replay_nodes,
+    replay_nodes_parallel,
+)
+from spectrum.serialization.canonical import (
+    serialization_cache_info,
+    serialize_node,
+    serialize_nodes,
+)
+
+
+def _nodes():
+    return tuple(
+        LatticeNode(
+            id=i,
+            state_vector=(Fraction(-i, 3), Fraction(10**30 + i, 7), Fraction(0)),
+            parents={i - 1, i - 3} if i > 2 else set(),
+        )
+        for i in range(12)
+    )
+
+
+def test_trusted_parse_matches_verified_parse():
+    lines = serialize_nodes(_nodes())
+
+    trusted = replay_nodes(lines, trusted=True)
+    assert trusted == replay_nodes(lines) == _nodes()
+    for n in trusted:
+        for x in n.state_vector:
+            assert hash(x) == hash(Fraction(x.numerator, x.denominator))
+    assert tuple(serialize_node(n) for n in trusted) == lines
+
+
+def test_trusted_parse_memoizes_the_line():
+    line = serialize_node(_nodes()[5])
+    node = parse_node(line, trusted=True)
+
+    before = serialization_cache_info()
+    assert serialize_node(node) is line
+    after = serialization_cache_info()
+    assert (after.line_hits, after.line_misses) == (
+        before.line_hits + 1,
+        before.line_misses,
+    )
+
+
+def test_parse_state_batches_a_field():
+    field = "1/2,-3/4,0/1"
+    expected = (Fraction(1, 2), Fraction(-3, 4), Fraction(0))
+
+    assert parse_state(field) == parse_state(field, trusted=True) == expected
+    assert parse_state("") == parse_state("", trusted=True) == ()
+
+
+def test_verified_mode_normalizes_untrusted_input():
+    assert parse_fraction("2/4") == Fraction(1, 2)
+    assert parse_node("id=1|state=2/4|parents=").state_vector == (Fraction(1, 2),)
+    with pytest.raises(ZeroDivisionError):
+        parse_fraction("1/0")
+
+
+def test_parallel_replay_trusted(tmp_path):
+    path = tmp_path / "lattice.txt"
+    path.write_text("".join(line + "\n" for line in serialize_nodes(_nodes())))
+
+    assert replay_nodes_parallel(str(path), workers=2, trusted=True) == _nodes()
+
+
+def test_trusted_parse_never_memoizes_non_canonical_lines():
+    canonical = "id=7|state=1/2,-3/4|parents=1,5"
+    for line in (
+        "id=7|state=2/4,-3/4|parents=1,5",
+        "id=7|state=1/2,-3/4|parents=5,1",
+        "id=07|state=1/2,-3/4|parents=1,5",
+        "id=7|state=1/2,-3/4|parents=1,+5",
+        "id=7|state=1/2,-3/4|parents=1,5,5",
+    ):
+        node = parse_node(line, trusted=True)
+        assert serialize_node(node) == canonical
+        assert node == parse_node(line)
+    assert parse_state("0/5,-0/1", trusted=True) == (Fraction(0), Fraction(0))